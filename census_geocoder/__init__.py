@@ -6,26 +6,57 @@ convenience, those items themselves are actually implemented and documented in
 child modules.
 """
 
-import os
-from census_geocoder import locations, geographies, errors
+import importlib
 
-# Get the version number from the _version.py file
-version_dict = {}
+from census_geocoder.__version__ import __version__
 
-with open(os.path.join(os.path.dirname(__file__), '__version__.py')) as version_file:
-    exec(version_file.read(), version_dict)
+_LAZY_ATTRIBUTES = {
+    'location': ('locations', 'Location'),
+    'geography': ('geographies', 'GeographicArea'),
+    'geography_collection': ('geographies', 'GeographyCollection'),
+    'matched_address': ('locations', 'MatchedAddress'),
+    'clear_cache': ('metaclasses', 'clear_cache'),
+    'enable_disk_cache': ('metaclasses', 'enable_disk_cache'),
+    'disable_disk_cache': ('metaclasses', 'disable_disk_cache'),
+    'session': ('metaclasses', 'SESSION'),
+    'geocode_many': ('_async', 'geocode_many'),
+    'geocode_batch': ('locations', 'Location.from_batch'),
+    'errors': ('errors', None),
+    'locations': ('locations', None),
+    'geographies': ('geographies', None),
+    'metaclasses': ('metaclasses', None),
+}
 
-__version__ = version_dict.get('__version__')
 
-location = locations.Location
-geography = geographies.GeographicArea
-geography_collection = geographies.GeographyCollection
-matched_address = locations.MatchedAddress
+def __getattr__(name):
+    """Import child modules lazily on first access (:pep:`562`)."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-__all__ = [
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(f'{__name__}.{module_name}')
+    value = module
+    for part in attribute.split('.') if attribute else []:
+        value = getattr(value, part)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
+
+
+__all__ = (
     'location',
     'geography',
     'geography_collection',
     'matched_address',
+    'clear_cache',
+    'enable_disk_cache',
+    'disable_disk_cache',
+    'session',
+    'geocode_many',
+    'geocode_batch',
     'errors'
-]
+)
@@ -0,0 +1,171 @@
+"""
+###################################
+census_geocoder/_async.py
+###################################
+
+Defines an :mod:`asyncio <python:asyncio>` entry point which geocodes many one-line
+addresses concurrently using `httpx <https://www.python-httpx.org/>`_.
+
+"""
+import asyncio
+
+from validator_collection import validators
+
+from census_geocoder import errors, metaclasses
+from census_geocoder.locations import Location
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+MAX_TRIES = 5
+MAX_DELAY = 10
+BASE_DELAY = 0.5
+
+
+async def _fetch(client, semaphore, url, cache_key):
+    """Request ``url``, retrying transport errors and server errors with exponential
+    backoff.
+
+    The response cache is checked again once a slot in ``semaphore`` has been acquired,
+    so that duplicate requests queued behind the first are served from the cache.
+
+    :returns: A ``(response, content)`` tuple, where ``response`` is :obj:`None
+      <python:None>` if ``content`` was found in the cache.
+    :rtype: :class:`tuple <python:tuple>`
+    """
+    for attempt in range(1, MAX_TRIES + 1):
+        async with semaphore:
+            content = metaclasses._get_cached(cache_key)
+            if content is not None:
+                return None, content
+
+            try:
+                result = await client.get(url)
+            except httpx.TransportError:
+                if attempt == MAX_TRIES:
+                    raise
+            else:
+                if result.status_code < 500 or attempt == MAX_TRIES:
+                    return result, None
+
+        await asyncio.sleep(min(BASE_DELAY * 2 ** (attempt - 1), MAX_DELAY))
+
+
+async def _geocode_one(client, semaphore, address, benchmark, vintage, layers):
+    """Geocode a single one-line address, consulting the response cache first.
+
+    :rtype: :class:`Location <census_geocoder.locations.Location>`
+    """
+    url = metaclasses._request_url('locations',
+                                   'onelineaddress',
+                                   benchmark,
+                                   vintage,
+                                   layers,
+                                   address = validators.string(address).strip())
+
+    cache_key = metaclasses._cache_key(url)
+    result = None
+    content = metaclasses._get_cached(cache_key)
+    if content is None:
+        result, content = await _fetch(client, semaphore, url, cache_key)
+
+    if result is not None:
+        if b'Specify street' in result.content:
+            raise errors.ConfigurationError('Did not provide a properly parametrized '
+                                            'address.')
+        elif errors.EntityNotFoundError.evaluate(result, request_type = 'locations'):
+            raise errors.EntityNotFoundError(
+                'Census Geocoder API was unable to find a matching geographic entity.'
+            )
+        elif result.status_code >= 400:
+            raise errors.CensusAPIError(
+                f'Census Geocoder API returned status code {result.status_code} with '
+                f'message: "{result.text}".'
+            )
+
+        content = result.content
+        metaclasses._set_cached(cache_key, content)
+
+    return Location.from_json(json_loads(content))
+
+
+async def geocode_many(addresses,
+                       concurrency = 4,
+                       benchmark = metaclasses.DEFAULT_BENCHMARK,
+                       vintage = metaclasses.DEFAULT_VINTAGE,
+                       layers = metaclasses.DEFAULT_LAYERS,
+                       return_exceptions = False):
+    """Geocode many one-line addresses concurrently.
+
+    Requests that fail with a transport error or a 5xx status code are retried up to
+    ``MAX_TRIES`` times with exponential backoff.
+
+    .. note::
+
+      Requires `httpx <https://www.python-httpx.org/>`_, which can be installed using
+      ``pip install census-geocoder[async]``.
+
+    :param addresses: The one-line addresses to geocode.
+    :type addresses: iterable of :class:`str <python:str>`
+
+    :param concurrency: The maximum number of requests to have in flight at any one
+      time. Defaults to ``4``.
+    :type concurrency: :class:`int <python:int>`
+
+    :param benchmark: The name of the :term:`benchmark` of data to return. The default
+      value is determined by the ``CENSUS_GEOCODER_BENCHMARK`` environment variable,
+      and if that is not set defaults to ``'Current'``.
+    :type benchmark: :class:`str <python:str>`
+
+    :param vintage: The vintage of Census data for which data should be returned. The
+      default value is determined by the ``CENSUS_GEOCODER_VINTAGE`` environment
+      variable, and if that is not set defaults to ``'Current'``.
+    :type vintage: :class:`str <python:str>`
+
+    :param layers: The set of geographic layers to return for the request. The default
+      value is determined by the ``CENSUS_GEOCODER_LAYERS`` environment variable, and
+      if that is not set defaults to ``'all'``.
+    :type layers: :class:`str <python:str>`
+
+    :param return_exceptions: If ``True``, errors raised while geocoding an address
+      (including an empty or invalid address) are returned in that address's position
+      rather than raised. Defaults to ``False``.
+    :type return_exceptions: :class:`bool <python:bool>`
+
+    :returns: The geocoded locations, in the same order as ``addresses``.
+    :rtype: :class:`list <python:list>` of
+      :class:`Location <census_geocoder.locations.Location>`
+
+    :raises ImportError: if `httpx <https://www.python-httpx.org/>`_ is not installed
+    :raises UnrecognizedBenchmarkError: if the ``benchmark`` supplied is not
+      recognized
+    :raises UnrecognizedVintageError: if the ``vintage`` supplied is not recognized
+
+    """
+    if httpx is None:
+        raise ImportError('geocode_many() requires httpx. Please install it using '
+                          '"pip install census-geocoder[async]".')
+
+    concurrency = validators.integer(concurrency, minimum = 1)
+    benchmark, vintage, layers = metaclasses.parse_benchmark_vintage_layers(benchmark,
+                                                                            vintage,
+                                                                            layers)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(http2 = True,
+                                 limits = httpx.Limits(
+                                     max_connections = concurrency
+                                 )) as client:
+        tasks = [_geocode_one(client, semaphore, address, benchmark, vintage, layers)
+                 for address in addresses]
+
+        return await asyncio.gather(*tasks, return_exceptions = return_exceptions)
@@ -1105,3 +1105,18 @@ LSAD = {
     'Z3': 'ZCTA3 (suffix)',
     'Z5': 'ZCTA5 (suffix)'
 }
+
+FUNCSTAT_CODES = frozenset(FUNCSTAT)
+
+LSAD_DESCRIPTIONS = {
+    key: value.replace(' (suffix)', '').replace(' (prefix)', '').replace(' (balance)', '')
+    for key, value in LSAD.items()
+}
+
+LSAD_CATEGORIES = {
+    key: ('Prefix' if '(prefix)' in value
+          else 'Suffix' if '(suffix)' in value
+          else 'Balance' if '(balance)' in value
+          else 'Unspecified')
+    for key, value in LSAD.items()
+}
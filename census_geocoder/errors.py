@@ -5,63 +5,127 @@
 # extension, and its member class documentation is automatically incorporated
 # there as needed.
 
-import warnings
-from validator_collection import validators
+import threading
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+    _MAPPING_TYPES = (dict,)
+else:
+    _MAPPING_TYPES = (dict, simdjson.Object)
+
+_EMPTY_RESULT = {'addressMatches': (), 'geographies': ()}
+
+_EMPTY_BODIES = frozenset((b'', b'{}', b'[]', b'{"result":null}', b'{"result":{}}'))
+_MAX_EMPTY_BODY_LENGTH = 32
+
+_PARSERS = threading.local()
+
+_EVALUATION_CACHE = OrderedDict()
+_EVALUATION_LOCK = threading.Lock()
+_EVALUATION_CACHE_SIZE = 1024
+
+
+def _parse_body(content):
+    """Parse a response body for evaluation.
+
+    When `pysimdjson <https://pysimdjson.tkte.ch/>`_ is installed the body is parsed
+    lazily, so the (potentially very large) geography arrays are never materialized
+    as Python objects. Otherwise the body is fully decoded using ``orjson`` or the
+    standard library ``json`` module.
+
+    :param content: The raw response body.
+    :type content: :class:`bytes <python:bytes>`
+
+    :returns: A mapping supporting ``.get()``.
+    """
+    if simdjson is None:
+        return orjson.loads(content)
+
+    # A simdjson document is only valid until its parser parses the next document,
+    # so each thread keeps a parser of its own.
+    parser = getattr(_PARSERS, 'parser', None)
+    if parser is None:
+        parser = _PARSERS.parser = simdjson.Parser()
+
+    return parser.parse(content)
+
+
+def _evaluate_locations(as_dict):
+    """Return ``True`` if a ``locations`` response contains no matched addresses."""
+    result_obj = as_dict.get('result') or _EMPTY_RESULT
+
+    return not result_obj.get('addressMatches')
+
+
+def _evaluate_geographies(as_dict):
+    """Return ``True`` if a ``geographies`` response contains neither matched
+    addresses nor geographies."""
+    result_obj = as_dict.get('result') or _EMPTY_RESULT
+
+    return not result_obj.get('geographies') and not result_obj.get('addressMatches')
 
 
 class CensusGeocoderError(ValueError):
     """Base error raised by the **Census Geocoder**. Inherits from
     :class:`ValueError <python:ValueError>`.
     """
-    pass
+    __slots__ = ()
 
 
 class CensusGeocoderWarning(UserWarning):
     """Base warning raised by the **Census Geocoder**. Inherits from
     :class:`UserWarning <python:warnings.UserWarning>`."""
-    pass
+    __slots__ = ()
 
 
 class CensusAPIError(CensusGeocoderError):
     """Error raised when the `Census Geocoder API`_ returned an error."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(CensusGeocoderError):
     """Error raised when a geocoding request was configured incorrectly."""
-    pass
+    __slots__ = ()
 
 
 class UnrecognizedBenchmarkError(ConfigurationError):
     """Error raised when a :term:`benchmark` has been specified incorrectly."""
-    pass
+    __slots__ = ()
 
 
 class UnrecognizedVintageError(ConfigurationError):
     """Error raised when a :term:`vintage` has been specified incorrectly."""
-    pass
+    __slots__ = ()
 
 
 class MalformedBatchFileError(ConfigurationError):
     """Error raised when a batch file is structured improperly."""
-    pass
+    __slots__ = ()
 
 
 class NoAddressError(ConfigurationError):
     """Error raised when there was no address supplied with the request."""
-    pass
+    __slots__ = ()
 
 
 class BatchSizeTooLargeError(ConfigurationError):
     """Error raised when the size of a batch address file exceeds the limit of 10,000
     imposed by the `Census Geocoder API`_."""
-    pass
+    __slots__ = ()
 
 
 class NoFileProvidedError(ConfigurationError):
     """Error raised when a batch file indicated in the request does not exist or cannot
     be read."""
-    pass
+    __slots__ = ()
 
 
 class EntityNotFoundError(CensusGeocoderError):
@@ -69,8 +133,15 @@ class EntityNotFoundError(CensusGeocoderError):
     from :class:`CensusGeocoderError`.
     """
 
-    @staticmethod
-    def evaluate(result, request_type = None):
+    __slots__ = ()
+
+    _EVALUATORS = {
+        'locations': _evaluate_locations,
+        'geographies': _evaluate_geographies,
+    }
+
+    @classmethod
+    def evaluate(cls, result, request_type = None):
         """Returns ``True`` if the `Census Geocoder API`_ was unable to match a geographic
         entity to the request. Returns ``False`` if the API was able to match
         successfully.
@@ -89,22 +160,37 @@ class EntityNotFoundError(CensusGeocoderError):
         if result.status_code == 404:
             return True
 
-        if result.text == '{}':
+        content = result.content
+        if len(content) <= _MAX_EMPTY_BODY_LENGTH and \
+           content.translate(None, b' \t\r\n') in _EMPTY_BODIES:
             return True
 
-        as_dict = validators.dict(result.json())
-
-        if request_type == 'locations':
-            matched_addresses = as_dict.get('result', {}).get('addressMatches', [])
-            if not matched_addresses:
-                return True
-
-        if request_type == 'geographies':
-            matched_addresses = as_dict.get('result', {}).get('addressMatches', [])
-            geographies = as_dict.get('result', {}).get('geographies', [])
-            if matched_addresses and not geographies:
-                return False
-            elif not geographies:
-                return True
-
-        return False
+        evaluator = cls._EVALUATORS.get(request_type, None)
+        if evaluator is None:
+            return False
+
+        # Keyed on the body itself (not just its hash) so that colliding bodies can
+        # never share an outcome. bytes objects cache their own hash, so re-evaluating
+        # the same response is still a constant-time lookup.
+        cache_key = (request_type, content)
+        with _EVALUATION_LOCK:
+            outcome = _EVALUATION_CACHE.get(cache_key, None)
+            if outcome is not None:
+                _EVALUATION_CACHE.move_to_end(cache_key)
+                return outcome
+
+        # A body that is not JSON (e.g. an HTML error page) is left for the caller's
+        # status code check to report.
+        try:
+            as_dict = _parse_body(content)
+        except ValueError:
+            as_dict = None
+
+        outcome = isinstance(as_dict, _MAPPING_TYPES) and evaluator(as_dict)
+
+        with _EVALUATION_LOCK:
+            _EVALUATION_CACHE[cache_key] = outcome
+            while len(_EVALUATION_CACHE) > _EVALUATION_CACHE_SIZE:
+                _EVALUATION_CACHE.popitem(last = False)
+
+        return outcome
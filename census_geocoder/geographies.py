@@ -6,97 +6,175 @@ census_geocoder/geographies.py
 Defines :class:`Geography` geographic entities.
 
 """
-from inspect import currentframe
+import sys
+from itertools import compress
+from operator import attrgetter
+from types import MappingProxyType
 
-from validator_collection import validators, checkers
+from validator_collection import validators
 
 from census_geocoder import metaclasses, errors
-from census_geocoder.constants import FUNCSTAT, LSAD
+from census_geocoder.constants import FUNCSTAT, FUNCSTAT_CODES, LSAD, \
+    LSAD_DESCRIPTIONS, LSAD_CATEGORIES
+
+
+# Maps each field returned by the Census Geocoder API to the GeographicArea property
+# which holds it. Shared by from_dict(), to_dict() and inspect().
+_FIELD_MAP = (
+    ('GEOID', 'geoid'),
+    ('OID', 'oid'),
+    ('OBJECTID', 'object_id'),
+    ('NAME', 'name'),
+    ('BASENAME', 'basename'),
+    ('FUNCSTAT', 'funcstat'),
+    ('LSAD', 'lsad'),
+    ('LSY', 'legislative_session_year'),
+    ('STATE', 'state_fips_code'),
+    ('STATENS', 'state_ns'),
+    ('STUSAB', 'state_abbreviation'),
+    ('DIVISION', 'division_fips_code'),
+    ('REGION', 'region_fips_code'),
+    ('TRACT', 'tract'),
+    ('BLOCK', 'block'),
+    ('BLKGRP', 'block_group'),
+    ('COUNTY', 'county_fips_code'),
+    ('COUNTYNS', 'county_ns'),
+    ('COUNTYCC', 'county_cc'),
+    ('PLACE', 'place'),
+    ('PLACENS', 'place_ns'),
+    ('PLACECC', 'place_cc'),
+    ('NECTAPCI', 'necta_pci'),
+    ('CBSAPCI', 'cbsa_pci'),
+    ('CDSESSN', 'congressional_session_code'),
+    ('ZCTA5', 'zcta5'),
+    ('ZCTA5CC', 'zcta5_cc'),
+    ('SDTYP', 'school_district_type'),
+    ('LOGRADE', 'low_school_grade'),
+    ('HIGRADE', 'high_school_grade'),
+    ('CSA', 'csa'),
+    ('CBSA', 'cbsa'),
+    ('CENTLON', 'longitude'),
+    ('CENTLAT', 'latitude'),
+    ('INTPTLON', 'longitude_internal_point'),
+    ('INTPTLAT', 'latitude_internal_point'),
+    ('AREAWATER', 'water_area'),
+    ('AREALAND', 'land_area')
+)
+
+_COORDINATE_KEYS = frozenset(('CENTLON', 'CENTLAT', 'INTPTLON', 'INTPTLAT'))
+
+# Derived properties which inspect() reports immediately after the field they are
+# computed from.
+_DERIVED_FIELDS = {
+    'funcstat': ('functional_status',),
+    'lsad': ('legal_statistical_area', 'lsad_category'),
+}
+
+_LAYER_REGISTRY = {}
 
 
 class GeographicArea(metaclasses.GeographicEntity):
-    """Base class for a given :term:`geography` as supported by the US government."""
+    """Base class for a given :term:`geography` as supported by the US government.
+
+    Coordinates are stored as :class:`Decimal <python:decimal.Decimal>` values. Set
+    ``float_coordinates`` to ``True`` (on this class, a subclass, or by setting the
+    ``CENSUS_GEOCODER_FLOAT_COORDINATES`` environment variable) to store them as
+    :class:`float <python:float>` instead, which is considerably faster to parse.
+
+    Sub-classes which declare a ``layer_name`` (the layer's name in `Census Geocoder
+    API`_ responses) and a ``collection_property`` (the corresponding
+    :class:`GeographyCollection` property) are registered in ``GEOGRAPHY_MAP``.
+    """
+
+    __slots__ = ('_geoid', '_oid', '_object_id', '_name', '_basename', '_funcstat',
+                 '_lsad', '_legislative_session_year', '_state_fips_code', '_state_ns',
+                 '_state_abbreviation', '_division_fips_code', '_region_fips_code',
+                 '_tract', '_block', '_block_group', '_lwblk_typ', '_county_fips_code',
+                 '_county_cc', '_county_ns', '_cousub_cc', '_cousub_ns', '_place',
+                 '_place_cc', '_place_ns', '_necta_pci', '_cbsa_pci',
+                 '_congressional_session_code', '_zcta5', '_zcta5_cc',
+                 '_school_district_type', '_sduni', '_low_school_grade',
+                 '_high_school_grade', '_vtd', '_vtdi', '_metdiv', '_csa', '_cbsa',
+                 '_latitude', '_longitude', '_latitude_internal_point',
+                 '_longitude_internal_point', '_water_area', '_land_area', '_pop100',
+                 '_hu100', '_sldu', '_sldl', '_mtfcc', '_ldtyp', '_ur', '_extensions')
+
+    entity_type = 'geographies'
+    float_coordinates = metaclasses.FLOAT_COORDINATES
+
+    _CENSUS_KEYS = dict(_FIELD_MAP)
+
+    _TO_DICT_KEYS = tuple(key for key, attribute in _FIELD_MAP
+                          if key not in _COORDINATE_KEYS)
+    _TO_DICT_GETTER = attrgetter(*(f'_{attribute}' for key, attribute in _FIELD_MAP
+                                   if key not in _COORDINATE_KEYS))
+
+    _TO_DICT_COORDINATES = tuple((key, f'_{attribute}') for key, attribute in _FIELD_MAP
+                                 if key in _COORDINATE_KEYS)
+
+    _INSPECT_CENSUS_NAMES = tuple(key for key, attribute in _FIELD_MAP)
+    _INSPECT_CENSUS_GETTER = attrgetter(*(f'_{attribute}'
+                                          for key, attribute in _FIELD_MAP))
+
+    _INSPECT_NAMES = tuple(name for key, attribute in _FIELD_MAP
+                           for name in (attribute, *_DERIVED_FIELDS.get(attribute, ())))
+    _INSPECT_GETTER = attrgetter(*(source for key, attribute in _FIELD_MAP
+                                   for source in (f'_{attribute}',
+                                                  *_DERIVED_FIELDS.get(attribute, ()))))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'layer_name' in vars(cls):
+            _LAYER_REGISTRY[cls.layer_name] = (cls.collection_property, cls)
 
     def __init__(self, **kwargs):
-        self._geoid = None
-        self._oid = None
-        self._object_id = None
-        self._name = None
-        self._basename = None
-        self._funcstat = None
-        self._lsad = None
-
-        self._legislative_session_year = None
-
-        self._state_fips_code = None
-        self._state_ns = None
-        self._state_abbreviation = None
-
-        self._division_fips_code = None
-        self._region_fips_code = None
-
-        self._tract = None
-        self._block = None
-        self._block_group = None
-        self._lwblk_typ = None
-
-        self._county_fips_code = None
-        self._county_cc = None
-        self._county_ns = None
-        self._cousub_cc = None
-        self._cousub_ns = None
-
-        self._place = None
-        self._place_cc = None
-        self._place_ns = None
-
-        self._necta_pci = None
-        self._cbsa_pci = None
-
-        self._congressional_session_code = None
-
-        self._zcta5 = None
-        self._zcta5_cc = None
-
-        self._school_district_type = None
-        self._sduni = None
-        self._low_school_grade = None
-        self._high_school_grade = None
-
-        self._vtd = None
-        self._vtdi = None
-
-        self._metdiv = None
-        self._csa = None
-        self._cbsa = None
-
-        self._latitude = None
-        self._longitude = None
-        self._latitude_internal_point = None
-        self._longitude_internal_point = None
-
-        self._water_area = None
-        self._land_area = None
-
-        self._pop100 = None
-        self._hu100 = None
-        self._sldu = None
-        self._sldl = None
-        self._mtfcc = None
-        self._ldtyp = None
-
-        self._ur = None
-        self.extensions = {}
-
-        for key in kwargs:
-            if hasattr(self, key):
-                setattr(self, key, kwargs.get(key, None))
+        for slot in GeographicArea.__slots__:
+            setattr(self, slot, None)
+
+        for key, value in kwargs.items():
+            if key not in self._KNOWN_FIELDS:
+                self.extensions[key] = value
+            elif value is None:
+                setattr(self, '_' + key, None)
             else:
-                self.extensions[key] = kwargs.get(key, None)
+                setattr(self, key, value)
+
+    def __eq__(self, other):
+        """Geographic areas of the same type are equal if they share a
+        :attr:`geoid <GeographicArea.geoid>`. Areas without a
+        :attr:`geoid <GeographicArea.geoid>` are only equal to themselves."""
+        if not isinstance(other, GeographicArea):
+            return NotImplemented
+        if self._geoid is None:
+            return self is other
+
+        return self.__class__ is other.__class__ and self._geoid == other._geoid
+
+    def __hash__(self):
+        if self._geoid is None:
+            return object.__hash__(self)
+
+        return hash(self._geoid)
 
     @property
-    def geoid(self):
-        """The Geographic Identifier.
+    def extensions(self):
+        """Fields returned by the `Census Geocoder API`_ which do not correspond to a
+        known property, keyed by their original name.
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        if self._extensions is None:
+            self._extensions = {}
+
+        return self._extensions
+
+    @extensions.setter
+    def extensions(self, value):
+        value = validators.dict(value, allow_empty = True)
+        self._extensions = value or None
+
+    geoid = metaclasses.StringField(
+        doc = """The Geographic Identifier.
 
         .. note::
 
@@ -104,59 +182,35 @@ class GeographicArea(metaclasses.GeographicEntity):
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._geoid
+    )
 
-    @geoid.setter
-    def geoid(self, value):
-        self._geoid = validators.string(value, allow_empty = True)
-
-    @property
-    def oid(self):
-        """The OID.
+    oid = metaclasses.StringField(
+        doc = """The OID.
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._oid
+    )
 
-    @oid.setter
-    def oid(self, value):
-        self._oid = validators.string(value, allow_empty = True)
-
-    @property
-    def object_id(self):
-        """The Object Identifier.
+    object_id = metaclasses.NumericField(
+        doc = """The Object Identifier.
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._object_id
+    )
 
-    @object_id.setter
-    def object_id(self, value):
-        self._object_id = validators.numeric(value, allow_empty = True)
-
-    @property
-    def name(self):
-        """The human-readable name of the geography.
+    name = metaclasses.StringField(
+        doc = """The human-readable name of the geography.
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._name
+    )
 
-    @name.setter
-    def name(self, value):
-        self._name = validators.string(value, allow_empty = True)
-
-    @property
-    def basename(self):
-        """The human-readable basename of the geography.
+    basename = metaclasses.StringField(
+        doc = """The human-readable basename of the geography.
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._basename
-
-    @basename.setter
-    def basename(self, value):
-        self._basename = validators.string(value, allow_empty = True)
+    )
 
     @property
     def functional_status(self):
@@ -168,7 +222,7 @@ class GeographicArea(metaclasses.GeographicEntity):
 
         :rtype: :class:`str <python:str>`
         """
-        return FUNCSTAT.get(self.funcstat, None)
+        return FUNCSTAT.get(self._funcstat, None)
 
     @property
     def funcstat(self):
@@ -180,22 +234,24 @@ class GeographicArea(metaclasses.GeographicEntity):
 
         :rtype: :class:`str <python:str>`
         """
-        return FUNCSTAT.get(self._funcstat, None)
+        return self._funcstat
 
     @funcstat.setter
     def funcstat(self, value):
         value = validators.string(value, allow_empty = True)
-        if value and value.upper() not in FUNCSTAT:
+        if not value:
+            self._funcstat = None
+            return
+
+        code = value.upper()
+        if code not in FUNCSTAT_CODES:
             raise ValueError(f'value ("{value}") not a recognized FUNCSTAT code')
 
-        if value:
-            self._funcstat = value.upper()
-        else:
-            self._funcstat = None
+        self._funcstat = sys.intern(code)
 
-    @property
-    def lsad(self):
-        """Legal/Statisical Area Descriptor (LSAD) Code
+    lsad = metaclasses.CodedField(
+        LSAD,
+        doc = """Legal/Statisical Area Descriptor (LSAD) Code
 
         .. seealso::
 
@@ -203,15 +259,7 @@ class GeographicArea(metaclasses.GeographicEntity):
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._lsad
-
-    @lsad.setter
-    def lsad(self, value):
-        value = validators.string(value, allow_empty = True)
-        if value and value.upper() in LSAD:
-            value = value.upper()
-
-        self._lsad = value
+    )
 
     @property
     def legal_statistical_area(self):
@@ -223,17 +271,7 @@ class GeographicArea(metaclasses.GeographicEntity):
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        if not self.lsad:
-            return None
-        result = LSAD.get(self.lsad, None)
-        if result and '(suffix)' in result:
-            result = result.replace(' (suffix)', '')
-        if result and '(prefix)' in result:
-            result = result.replace(' (prefix)', '')
-        if result and '(balance)' in result:
-            result = result.replace(' (balance)', '')
-
-        return result
+        return LSAD_DESCRIPTIONS.get(self._lsad, None)
 
     @property
     def lsad_category(self):
@@ -246,16 +284,7 @@ class GeographicArea(metaclasses.GeographicEntity):
 
         :rtype: :class:`str <python:str>`
         """
-        result = "Unspecified"
-        lsad = LSAD.get(self.lsad, '')
-        if '(prefix)' in lsad:
-            result = 'Prefix'
-        elif '(suffix)' in lsad:
-            result = 'Suffix'
-        elif '(balance)' in lsad:
-            result = 'Balance'
-
-        return result
+        return LSAD_CATEGORIES.get(self._lsad, 'Unspecified')
 
     @property
     def legislative_session_year(self):
@@ -273,29 +302,19 @@ class GeographicArea(metaclasses.GeographicEntity):
 
         self._legislative_session_year = value
 
-    @property
-    def state_fips_code(self):
-        """State FIPS Code
+    state_fips_code = metaclasses.InternedField(
+        doc = """State FIPS Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._state_fips_code
-
-    @state_fips_code.setter
-    def state_fips_code(self, value):
-        self._state_fips_code = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def state_ns(self):
-        """State ANSI Feature Code
+    state_ns = metaclasses.InternedField(
+        doc = """State ANSI Feature Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._state_ns
-
-    @state_ns.setter
-    def state_ns(self, value):
-        self._state_ns = validators.string(value, allow_empty = True)
+    )
 
     @property
     def state_abbreviation(self):
@@ -309,141 +328,86 @@ class GeographicArea(metaclasses.GeographicEntity):
     def state_abbreviation(self, value):
         value = validators.string(value, allow_empty = True)
         if value:
-            value = value.upper()
+            value = sys.intern(value.upper())
 
         self._state_abbreviation = value
 
-    @property
-    def division_fips_code(self):
-        """State FIPS Code
+    division_fips_code = metaclasses.InternedField(
+        doc = """State FIPS Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._division_fips_code
-
-    @division_fips_code.setter
-    def division_fips_code(self, value):
-        self._division_fips_code = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def region_fips_code(self):
-        """Region FIPS Code
+    region_fips_code = metaclasses.InternedField(
+        doc = """Region FIPS Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._region_fips_code
-
-    @region_fips_code.setter
-    def region_fips_code(self, value):
-        self._region_fips_code = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def tract(self):
-        """Census Tract Code
+    tract = metaclasses.StringField(
+        doc = """Census Tract Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._tract
-
-    @tract.setter
-    def tract(self, value):
-        self._tract = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def block(self):
-        """Census Block Code
+    block = metaclasses.StringField(
+        doc = """Census Block Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._block
-
-    @block.setter
-    def block(self, value):
-        self._block = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def block_group(self):
-        """Census Block Group Code
+    block_group = metaclasses.StringField(
+        doc = """Census Block Group Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._block_group
-
-    @block_group.setter
-    def block_group(self, value):
-        self._block_group = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def county_fips_code(self):
-        """County FIPS Code
+    county_fips_code = metaclasses.InternedField(
+        doc = """County FIPS Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._county_fips_code
-
-    @county_fips_code.setter
-    def county_fips_code(self, value):
-        self._county_fips_code = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def county_cc(self):
-        """County Class Code
+    county_cc = metaclasses.InternedField(
+        doc = """County Class Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._county_cc
-
-    @county_cc.setter
-    def county_cc(self, value):
-        self._county_cc = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def county_ns(self):
-        """County ANSI Feature Code
+    county_ns = metaclasses.StringField(
+        doc = """County ANSI Feature Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._county_ns
-
-    @county_ns.setter
-    def county_ns(self, value):
-        self._county_ns = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def place(self):
-        """Census Place Code
+    place = metaclasses.StringField(
+        doc = """Census Place Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._place
-
-    @place.setter
-    def place(self, value):
-        self._place = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def place_cc(self):
-        """Place Class Code
+    place_cc = metaclasses.InternedField(
+        doc = """Place Class Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._place_cc
-
-    @place_cc.setter
-    def place_cc(self, value):
-        self._place_cc = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def place_ns(self):
-        """Place ANSI Feature Code
+    place_ns = metaclasses.StringField(
+        doc = """Place ANSI Feature Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._place_ns
-
-    @place_ns.setter
-    def place_ns(self, value):
-        self._place_ns = validators.string(value, allow_empty = True)
+    )
 
     @property
     def necta_pci(self):
@@ -492,179 +456,94 @@ class GeographicArea(metaclasses.GeographicEntity):
 
         :rtype: :class:`bool <python:bool>`
         """
-        return self.cbsa_pci == 'Y' or self.necta_pci == 'Y'
+        return self._cbsa_pci == 'Y' or self._necta_pci == 'Y'
 
-    @property
-    def congressional_session_code(self):
-        """Congressional Session Code
+    congressional_session_code = metaclasses.InternedField(
+        doc = """Congressional Session Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._congressional_session_code
-
-    @congressional_session_code.setter
-    def congressional_session_code(self, value):
-        self._congressional_session_code = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def zcta5(self):
-        """ZCTA-5 Zip Code Value
+    zcta5 = metaclasses.StringField(
+        doc = """ZCTA-5 Zip Code Value
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._zcta5
-
-    @zcta5.setter
-    def zcta5(self, value):
-        self._zcta5 = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def zcta5_cc(self):
-        """ZCTA5 Class Code
+    zcta5_cc = metaclasses.InternedField(
+        doc = """ZCTA5 Class Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._zcta5_cc
-
-    @zcta5_cc.setter
-    def zcta5_cc(self, value):
-        self._zcta5_cc = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def school_district_type(self):
-        """School District Type
+    school_district_type = metaclasses.InternedField(
+        doc = """School District Type
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._school_district_type
-
-    @school_district_type.setter
-    def school_district_type(self, value):
-        self._school_district_type = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def low_school_grade(self):
-        """School District - Lowest Grade
+    low_school_grade = metaclasses.InternedField(
+        doc = """School District - Lowest Grade
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._low_school_grade
-
-    @low_school_grade.setter
-    def low_school_grade(self, value):
-        self._low_school_grade = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def high_school_grade(self):
-        """School District - Highest Grade
+    high_school_grade = metaclasses.InternedField(
+        doc = """School District - Highest Grade
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._high_school_grade
-
-    @high_school_grade.setter
-    def high_school_grade(self, value):
-        self._high_school_grade = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def csa(self):
-        """Census CSA Code
+    csa = metaclasses.StringField(
+        doc = """Census CSA Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._csa
-
-    @csa.setter
-    def csa(self, value):
-        self._csa = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def cbsa(self):
-        """Census CBSA Code
+    cbsa = metaclasses.StringField(
+        doc = """Census CBSA Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._cbsa
-
-    @cbsa.setter
-    def cbsa(self, value):
-        self._cbsa = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def latitude(self):
-        """The :term:`centroid latitude` for the geographic area.
+    latitude = metaclasses.CoordinateField(
+        doc = """The :term:`centroid latitude` for the geographic area.
 
         :rtype: :class:`Decimal <python:decimal.Decimal>` / :obj:`None <python:None>`
         """
-        return self._latitude
-
-    @latitude.setter
-    def latitude(self, value):
-        value = validators.string(value, allow_empty = True)
-        if value and value.startswith('+'):
-            value = value[1:]
-        if value and value.startswith('0'):
-            value = value[1:]
-
-        self._latitude = validators.decimal(value, allow_empty = True)
+    )
 
-    @property
-    def latitude_internal_point(self):
-        """The :term:`internal point latitude` for the geographic area.
+    latitude_internal_point = metaclasses.CoordinateField(
+        doc = """The :term:`internal point latitude` for the geographic area.
 
         :rtype: :class:`Decimal <python:decimal.Decimal>` / :obj:`None <python:None>`
         """
-        return self._latitude_internal_point
-
-    @latitude_internal_point.setter
-    def latitude_internal_point(self, value):
-        value = validators.string(value, allow_empty = True)
-        if value and value.startswith('+'):
-            value = value[1:]
-        if value and value.startswith('0'):
-            value = value[1:]
-
-        self._latitude_internal_point = validators.decimal(value, allow_empty = True)
+    )
 
-    @property
-    def longitude(self):
-        """The :term:`centroid longitude` for the geographic area.
+    longitude = metaclasses.CoordinateField(
+        doc = """The :term:`centroid longitude` for the geographic area.
 
         :rtype: :class:`Decimal <python:decimal.Decimal>` / :obj:`None <python:None>`
         """
-        return self._longitude
-
-    @longitude.setter
-    def longitude(self, value):
-        value = validators.string(value, allow_empty = True)
-        if value and value.startswith('+'):
-            value = value[1:]
-        if value and value.startswith('0'):
-            value = value[1:]
-
-        self._longitude = validators.decimal(value, allow_empty = True)
+    )
 
-    @property
-    def longitude_internal_point(self):
-        """The :term:`internal point longitude` for the geographic area.
+    longitude_internal_point = metaclasses.CoordinateField(
+        doc = """The :term:`internal point longitude` for the geographic area.
 
         :rtype: :class:`Decimal <python:decimal.Decimal>` / :obj:`None <python:None>`
         """
-        return self._longitude_internal_point
-
-    @longitude_internal_point.setter
-    def longitude_internal_point(self, value):
-        value = validators.string(value, allow_empty = True)
-        if value and value.startswith('+'):
-            value = value[1:]
-        if value and value.startswith('0'):
-            value = value[1:]
-
-        self._longitude_internal_point = validators.decimal(value, allow_empty = True)
+    )
 
-    @property
-    def water_area(self):
-        """The area of the geography that is covered in water, expressed in square meters.
+    water_area = metaclasses.IntegerField(
+        doc = """The area of the geography that is covered in water, expressed in square meters.
 
         .. note::
 
@@ -673,28 +552,17 @@ class GeographicArea(metaclasses.GeographicEntity):
           of :meth:`land_area <Geography.land_area>` calculations.
 
         :rtype: :class:`int <python:int>` / :obj:`None <python:None>`
-        """
-        return self._water_area
+        """,
+        minimum = 0
+    )
 
-    @water_area.setter
-    def water_area(self, value):
-        self._water_area = validators.integer(value, allow_empty = True, minimum = 0)
-
-    @property
-    def land_area(self):
-        """The area of the geography that is on solid land, expressed in square meters.
+    land_area = metaclasses.IntegerField(
+        doc = """The area of the geography that is on solid land, expressed in square meters.
 
         :rtype: :class:`int <python:int>` / :obj:`None <python:None>`
-        """
-        return self._land_area
-
-    @land_area.setter
-    def land_area(self, value):
-        self._land_area = validators.integer(value, allow_empty = True, minimum = 0)
-
-    @property
-    def entity_type(self):
-        return 'geographies'
+        """,
+        minimum = 0
+    )
 
     @property
     def geography_type(self):
@@ -712,116 +580,92 @@ class GeographicArea(metaclasses.GeographicEntity):
         :rtype: :class:`Geography`
 
         """
-        csv_record = validators.iterable(csv_record, allow_empty = False)
+        return cls.from_csv_records([csv_record])[0]
+
+    @classmethod
+    def from_csv_records(cls, csv_records):
+        """Create instances of the geographic entity from many CSV records.
+
+        Produces the same result as calling :meth:`from_csv_record` on each record, but
+        resolves the field validators once for the whole collection and stores each
+        value directly in its slot.
+
+        :param csv_records: The CSV records, each a list of columns.
+        :type csv_records: iterable of :class:`list <python:list>` of
+          :class:`str <python:str>`
+
+        :returns: Instances of the geographic entity, one per record.
+        :rtype: :class:`list <python:list>` of :class:`Geography`
+
+        """
+        as_float = cls.float_coordinates
+        validate_coordinate = cls.longitude.validate
+        targets = tuple((getattr(cls, name).attribute, getattr(cls, name).validate, index)
+                        for name, index in (('state_fips_code', 8),
+                                            ('county_fips_code', 9),
+                                            ('tract', 10),
+                                            ('block', 11)))
+
+        results = []
+        for csv_record in csv_records:
+            if not csv_record or not isinstance(csv_record, (list, tuple)):
+                csv_record = validators.iterable(csv_record, allow_empty = False)
 
-        coordinates = csv_record[5].split(',')
-        longitude = coordinates[0]
-        latitude = coordinates[1]
+            longitude, latitude = csv_record[5].split(',', 1)
 
-        state_fips_code = csv_record[8]
-        county_fips_code = csv_record[9]
-        tract = csv_record[10]
-        block = csv_record[11]
+            result = cls()
+            result._longitude = validate_coordinate(longitude, as_float = as_float)
+            result._latitude = validate_coordinate(latitude, as_float = as_float)
+            for attribute, validate, index in targets:
+                setattr(result, attribute, validate(csv_record[index]))
 
-        return cls(state_fips_code = state_fips_code,
-                   county_fips_code = county_fips_code,
-                   tract = tract,
-                   block = block,
-                   longitude = longitude,
-                   latitute = latitude)
+            results.append(result)
+
+        return results
 
     @classmethod
     def from_dict(cls, as_dict):
-        geoid = as_dict.pop('GEOID', None)
-        oid = as_dict.pop('OID', None)
-        object_id = as_dict.pop('OBJECTID', None)
-        name = as_dict.pop('NAME', None)
-        basename = as_dict.pop('BASENAME', name)
-        funcstat = as_dict.pop('FUNCSTAT', None)
-        lsad = as_dict.pop('LSAD', None)
-        legislative_session_year = as_dict.pop('LSY', None)
-
-        state_fips_code = as_dict.pop('STATE', None)
-        state_ns = as_dict.pop('STATENS', None)
-        state_abbreviation = as_dict.pop('STUSAB', None)
-
-        division_fips_code = as_dict.pop('DIVISION', None)
-        region_fips_code = as_dict.pop('REGION', None)
-
-        tract = as_dict.pop('TRACT', None)
-        block = as_dict.pop('BLOCK', None)
-        block_group = as_dict.pop('BLKGRP', None)
-
-        county_fips_code = as_dict.pop('COUNTY', None)
-        county_cc = as_dict.pop('COUNTYCC', None)
-        county_ns = as_dict.pop('COUNTYNS', None)
-
-        place = as_dict.pop('PLACE', None)
-        place_cc = as_dict.pop('PLACECC', None)
-        place_ns = as_dict.pop('PLACENS', None)
-
-        necta_pci = as_dict.pop('NECTAPCI', None)
-        cbsa_pci = as_dict.pop('CBSAPCI', None)
-
-        congressional_session_code = as_dict.pop('CDSESSN', None)
-
-        zcta5 = as_dict.pop('ZCTA5', None)
-        zcta5_cc = as_dict.pop('ZCTA5CC', None)
-
-        school_district_type = as_dict.pop('SDTYP', None)
-        low_school_grade = as_dict.pop('LOGRADE', None)
-        high_school_grade = as_dict.pop('HIGRADE', None)
-
-        csa = as_dict.pop('CSA', None)
-        cbsa = as_dict.pop('CBSA', None)
-
-        longitude = as_dict.pop('CENTLON', None)
-        latitude = as_dict.pop('CENTLAT', None)
-        longitude_internal_point = as_dict.pop('INTPTLON', None)
-        latitude_internal_point = as_dict.pop('INTPTLAT', None)
-
-        water_area = as_dict.pop('AREAWATER', None)
-        land_area = as_dict.pop('AREALAND', None)
-
-        return cls(geoid = geoid,
-                   oid = oid,
-                   object_id = object_id,
-                   name = name,
-                   basename = basename,
-                   funcstat = funcstat,
-                   lsad = lsad,
-                   legislative_session_year = legislative_session_year,
-                   state_fips_code = state_fips_code,
-                   state_ns = state_ns,
-                   state_abbreviation = state_abbreviation,
-                   division_fips_code = division_fips_code,
-                   region_fips_code = region_fips_code,
-                   tract = tract,
-                   block = block,
-                   block_group = block_group,
-                   county_fips_code = county_fips_code,
-                   county_cc = county_cc,
-                   county_ns = county_ns,
-                   place = place,
-                   place_cc = place_cc,
-                   place_ns = place_ns,
-                   necta_pci = necta_pci,
-                   cbsa_pci = cbsa_pci,
-                   congressional_session_code = congressional_session_code,
-                   zcta5 = zcta5,
-                   zcta5_cc = zcta5_cc,
-                   school_district_type = school_district_type,
-                   low_school_grade = low_school_grade,
-                   high_school_grade = high_school_grade,
-                   csa = csa,
-                   cbsa = cbsa,
-                   longitude = longitude,
-                   latitude = latitude,
-                   longitude_internal_point = longitude_internal_point,
-                   latitude_internal_point = latitude_internal_point,
-                   water_area = water_area,
-                   land_area = land_area,
-                   **as_dict)
+        """Create an instance of the geographic entity from its
+        :class:`dict <python:dict>` representation, keyed by the field names used by
+        the `Census Geocoder API`_.
+
+        Keys that do not correspond to a known field are stored in
+        :attr:`extensions <GeographicArea.extensions>`.
+
+        :param as_dict: The :class:`dict <python:dict>` representation of the geographic
+          entity.
+        :type as_dict: :class:`dict <python:dict>`
+
+        :returns: An instance of the geographic entity.
+        :rtype: :class:`GeographicArea`
+
+        """
+        result = cls()
+        as_float = cls.float_coordinates
+        dict_targets = cls._DICT_TARGETS
+        census_keys = cls._CENSUS_KEYS
+        known_fields = cls._KNOWN_FIELDS
+        for key, value in as_dict.items():
+            target = dict_targets.get(key)
+            if target is not None:
+                if value is not None:
+                    attribute, validate, is_coordinate = target
+                    setattr(result,
+                            attribute,
+                            validate(value, as_float = as_float) if is_coordinate
+                            else validate(value))
+                continue
+
+            field = census_keys.get(key, key)
+            if field not in known_fields:
+                result.extensions[key] = value
+            elif value is not None:
+                setattr(result, field, value)
+
+        if 'BASENAME' not in as_dict:
+            result.basename = result.name
+
+        return result
 
     def to_dict(self):
         """Returns a :class:`dict <python:dict>` representation of the geographic entity.
@@ -841,69 +685,14 @@ class GeographicArea(metaclasses.GeographicEntity):
         :returns: :class:`dict <python:dict>` representation of the entity.
         :rtype: :class:`dict <python:dict>`
         """
-        result = {
-            'GEOID': self.geoid,
-            'OID': self.oid,
-            'OBJECT_ID': self.object_id,
-            'NAME': self.name,
-            'BASENAME': self.basename,
-            'FUNCSTAT': self.funcstat,
-            'LSAD': self.lsad,
-            'LSY': self.lsy,
-            'STATE': self.state_fips_code,
-            'STATE_NS': self.state_ns,
-            'STUSAB': self.state_abbreviation,
-            'DIVISION': self.division_fips_code,
-            'REGION': self.region_fips_code,
-            'TRACT': self.tract,
-            'BLOCK': self.block,
-            'BLKGRP': self.block_group,
-            'COUNTY': self.county_fips_code,
-            'COUNTYCC': self.county_cc,
-            'COUNTYNS': self.county_ns,
-            'PLACE': self.place,
-            'PLACECC': self.place_cc,
-            'PLACENS': self.place_ns,
-            'NECTAPCI': self.necta_pci,
-            'CBSAPCI': self.cbsa_pci,
-            'CDSESSN': self.congressional_session_code,
-            'ZCTA5': self.zcta5,
-            'ZCTA5CC': self.zcta5_cc,
-            'SDTYP': self.school_district_type,
-            'LOGRADE': self.low_school_grade,
-            'HIGRADE': self.high_school_grade,
-            'CSA': self.csa,
-            'CBSA': self.cbsa,
-            'AREAWATER': self.water_area,
-            'AREALAND': self.land_area
-        }
-        if self.longitude:
-            if self.longitude >= 0:
-                prefix = '+'
-            else:
-                prefix = ''
-            result['CENTLON'] = f'{prefix}{self.longitude:.8f}'
-        if self.latitude:
-            if self.latitude >= 0:
-                prefix = '+'
-            else:
-                prefix = ''
-            result['CENTLAT'] = f'{prefix}{self.latitude:.8f}'
-        if self.longitude_internal_point:
-            if self.longitude_internal_point >= 0:
-                prefix = '+'
-            else:
-                prefix = ''
-            result['INTPTLON'] = f'{prefix}{self.longitude_internal_point:.8f}'
-        if self.latitude_internal_point:
-            if self.latitude_internal_point >= 0:
-                prefix = '+'
-            else:
-                prefix = ''
-            result['INTPTLAT'] = f'{prefix}{self.latitude_internal_point:.8f}'
+        result = dict(zip(self._TO_DICT_KEYS, self._TO_DICT_GETTER(self)))
+        for key, attribute in self._TO_DICT_COORDINATES:
+            value = getattr(self, attribute)
+            if value is not None:
+                result[key] = format(value, '+.8f')
 
-        for key in self.extensions:
-            result[key] = self.extensions.get(key)
+        if self._extensions:
+            result.update(self._extensions)
 
         return result
 
@@ -918,873 +707,731 @@ class GeographicArea(metaclasses.GeographicEntity):
 
         :rtype: :class:`list <python:list>` of :class:`str <python:str>`
         """
-        result = []
-
-        if self.geoid and as_census_fields:
-            result.append('GEOID')
-        elif self.geoid:
-            result.append('geoid')
-
-        if self.oid and as_census_fields:
-            result.append('OID')
-        elif self.oid:
-            result.append('oid')
-
-        if self.object_id and as_census_fields:
-            result.append('OBJECTID')
-        elif self.object_id:
-            result.append('object_id')
-
-        if self.name and as_census_fields:
-            result.append('NAME')
-        elif self.name:
-            result.append('name')
-        if self.basename and as_census_fields:
-            result.append('BASENAME')
-        elif self.basename:
-            result.append('basename')
-
-        if self.funcstat and as_census_fields:
-            result.append('FUNCSTAT')
-        elif self.funcstat:
-            result.append('funcstat')
-        if self.functional_status and not as_census_fields:
-            result.append('functional_status')
-
-        if self.lsad and as_census_fields:
-            result.append('LSAD')
-        elif self.lsad:
-            result.append('lsad')
-        if self.legal_statistical_area and not as_census_fields:
-            result.append('legal_statistical_area')
-        if self.lsad_category and not as_census_fields:
-            result.append('lsad_category')
-
-        if self.legislative_session_year and as_census_fields:
-            result.append('LSY')
-        elif self.legislative_session_year:
-            result.append('legislative_session_year')
-
-        if self.state_fips_code and as_census_fields:
-            result.append('STATE')
-        elif self.state_fips_code:
-            result.append('state_fips_code')
-        if self.state_ns and as_census_fields:
-            result.append('STATENS')
-        elif self.state_ns:
-            result.append('state_ns')
-        if self.state_abbreviation and as_census_fields:
-            result.append('STUSAB')
-        elif self.state_abbreviation:
-            result.append('state_abbreviation')
-
-        if self.division_fips_code and as_census_fields:
-            result.append('DIVISION')
-        elif self.division_fips_code:
-            result.append('division_fips_code')
-        if self.region_fips_code and as_census_fields:
-            result.append('REGION')
-        elif self.region_fips_code:
-            result.append('region_fips_code')
-
-        if self.tract and as_census_fields:
-            result.append('TRACT')
-        elif self.tract:
-            result.append('tract')
-        if self.block and as_census_fields:
-            result.append('BLOCK')
-        elif self.block:
-            result.append('block')
-        if self.block_group and as_census_fields:
-            result.append('BLKGRP')
-        elif self.block_group:
-            result.append('block_group')
-
-        if self.county_fips_code and as_census_fields:
-            result.append('COUNTY')
-        elif self.county_fips_code:
-            result.append('county_fips_code')
-        if self.county_ns and as_census_fields:
-            result.append('COUNTYNS')
-        elif self.county_ns:
-            result.append('county_ns')
-        if self.county_cc and as_census_fields:
-            result.append('COUNTYCC')
-        elif self.county_cc:
-            result.append('county_cc')
-
-        if self.place_fips_code and as_census_fields:
-            result.append('PLACE')
-        elif self.place_fips_code:
-            result.append('place_fips_code')
-        if self.place_ns and as_census_fields:
-            result.append('PLACENS')
-        elif self.place_ns:
-            result.append('place_ns')
-        if self.place_cc and as_census_fields:
-            result.append('PLACECC')
-        elif self.place_cc:
-            result.append('place_cc')
-
-        if self.necta_pci and as_census_fields:
-            result.append('NECTAPCI')
-        elif self.necta_pci:
-            result.append('necta_pci')
-        if self.cbsa_pci and as_census_fields:
-            result.append('CBSAPCI')
-        elif self.cbsa_pci:
-            result.append('cbsa_pci')
-
-        if self.congressional_session_code and as_census_fields:
-            result.append('CDSESSN')
-        elif self.congressional_session_code:
-            result.append('congressional_session_code')
-
-        if self.zcta5 and as_census_fields:
-            result.append('ZCTA5')
-        elif self.zcta5:
-            result.append('zcta5')
-        if self.zcta5_cc and as_census_fields:
-            result.append('ZCTA5CC')
-        elif self.zcta5_cc:
-            result.append('zcta5_cc')
-
-        if self.school_district_type and as_census_fields:
-            result.append('SDTYP')
-        elif self.school_district_type:
-            result.append('school_district_type')
-        if self.low_school_grade and as_census_fields:
-            result.append('LOGRADE')
-        elif self.low_school_grade:
-            result.append('low_school_grade')
-        if self.high_school_grade and as_census_fields:
-            result.append('HIGRADE')
-        elif self.high_school_grade:
-            result.append('high_school_grade')
-
-        if self.csa and as_census_fields:
-            result.append('CSA')
-        elif self.csa:
-            result.append('csa')
-        if self.cbsa and as_census_fields:
-            result.append('CBSA')
-        elif self.cbsa:
-            result.append('cbsa')
-
-        if self.longitude and as_census_fields:
-            result.append('CENTLON')
-        elif self.longitude:
-            result.append('longitude')
-        if self.latitude and as_census_fields:
-            result.append('CENTLAT')
-        elif self.latitude:
-            result.append('latitude')
-        if self.longitude_internal_point and as_census_fields:
-            result.append('INTPTLON')
-        elif self.longitude_internal_point:
-            result.append('longitude_internal_point')
-        if self.latitude_internal_point and as_census_fields:
-            result.append('INTPTLAT')
-        elif self.latitude_internal_point:
-            result.append('latitude_internal_point')
-
-        if self.water_area and as_census_fields:
-            result.append('AREAWATER')
-        elif self.water_area:
-            result.append('water_area')
-        if self.land_area and as_census_fields:
-            result.append('AREALAND')
-        elif self.land_area:
-            result.append('land_area')
+        if as_census_fields:
+            names, values = self._INSPECT_CENSUS_NAMES, self._INSPECT_CENSUS_GETTER(self)
+        else:
+            names, values = self._INSPECT_NAMES, self._INSPECT_GETTER(self)
 
-        return result
+        return list(compress(names, values))
+
+
+GeographicArea._KNOWN_FIELDS = frozenset(
+    name for name, member in vars(GeographicArea).items()
+    if isinstance(member, metaclasses.StringField) or \
+       (isinstance(member, property) and member.fset is not None)
+)
+
+# Census field name to (slot, validator, is-coordinate) for the fields backed by a
+# descriptor, so that from_dict() can store validated values directly in their slots.
+GeographicArea._DICT_TARGETS = {
+    key: (member.attribute, member.validate,
+          isinstance(member, metaclasses.CoordinateField))
+    for key, member in ((key, vars(GeographicArea)[attribute])
+                        for key, attribute in _FIELD_MAP)
+    if isinstance(member, metaclasses.StringField)
+}
 
 
 class PUMA(GeographicArea):
     """Public Use Microdata Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Public Use Microdata Area'
+    __slots__ = ()
+
+    geography_type = 'Public Use Microdata Area'
+    layer_name = 'Public Use Microdata Areas'
+    collection_property = 'pumas'
 
 
 class PUMA_2010(PUMA):
     """2010 Census Public Use Microdata Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2010 Census Public Use Microdata Area'
+    __slots__ = ()
+
+    geography_type = '2010 Census Public Use Microdata Area'
+    layer_name = '2010 Census Public Use Microdata Areas'
+    collection_property = 'pumas_2010'
 
 
 class StateLegislativeDistrictLower(GeographicArea):
     """State Legislative District - Lower"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'State Legislative District - Lower'
+    __slots__ = ()
+
+    geography_type = 'State Legislative District - Lower'
+    layer_name = 'State Legislative Districts - Lower'
+    collection_property = 'state_legislative_districts_lower'
 
 
 class StateLegislativeDistrictUpper(GeographicArea):
     """State Legislative District - Upper"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'State Legislative District - Upper'
+    __slots__ = ()
+
+    geography_type = 'State Legislative District - Upper'
+    layer_name = 'State Legislative Districts - Upper'
+    collection_property = 'state_legislative_districts_upper'
 
 
 class StateLegislativeDistrictLower_2018(StateLegislativeDistrictLower):
     """2018 State Legislative District - Lower"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2018 State Legislative District - Lower'
+    __slots__ = ()
+
+    geography_type = '2018 State Legislative District - Lower'
+    layer_name = '2018 State Legislative Districts - Lower'
+    collection_property = 'state_legislative_districts_lower_2018'
 
 
 class StateLegislativeDistrictUpper_2018(StateLegislativeDistrictUpper):
     """2018 State Legislative District - Upper"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2018 State Legislative District - Upper'
+    __slots__ = ()
+
+    geography_type = '2018 State Legislative District - Upper'
+    layer_name = '2018 State Legislative Districts - Upper'
+    collection_property = 'state_legislative_districts_upper_2018'
 
 
 class StateLegislativeDistrictLower_2016(StateLegislativeDistrictLower):
     """2016 State Legislative District - Lower"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2016 State Legislative District - Lower'
+    __slots__ = ()
+
+    geography_type = '2016 State Legislative District - Lower'
+    layer_name = '2016 State Legislative Districts - Lower'
+    collection_property = 'state_legislative_districts_lower_2016'
 
 
 class StateLegislativeDistrictUpper_2016(StateLegislativeDistrictUpper):
     """2016 State Legislative District - Upper"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2016 State Legislative District - Upper'
+    __slots__ = ()
+
+    geography_type = '2016 State Legislative District - Upper'
+    layer_name = '2016 State Legislative Districts - Upper'
+    collection_property = 'state_legislative_districts_upper_2016'
 
 
 class StateLegislativeDistrictLower_2012(StateLegislativeDistrictLower):
     """2012 State Legislative District - Lower"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2012 State Legislative District - Lower'
+    __slots__ = ()
+
+    geography_type = '2012 State Legislative District - Lower'
+    layer_name = '2012 State Legislative Districts - Lower'
+    collection_property = 'state_legislative_districts_lower_2012'
 
 
 class StateLegislativeDistrictUpper_2012(StateLegislativeDistrictUpper):
     """2012 State Legislative District - Upper"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2012 State Legislative District - Upper'
+    __slots__ = ()
+
+    geography_type = '2012 State Legislative District - Upper'
+    layer_name = '2012 State Legislative Districts - Upper'
+    collection_property = 'state_legislative_districts_upper_2012'
 
 
 class StateLegislativeDistrictLower_2010(StateLegislativeDistrictLower):
     """2010 State Legislative District - Lower"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2010 State Legislative District - Lower'
+    __slots__ = ()
+
+    geography_type = '2010 State Legislative District - Lower'
+    layer_name = '2010 State Legislative Districts - Lower'
+    collection_property = 'state_legislative_districts_lower_2010'
 
 
 class StateLegislativeDistrictUpper_2010(StateLegislativeDistrictUpper):
     """2010 State Legislative District - Upper"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2010 State Legislative District - Upper'
+    __slots__ = ()
+
+    geography_type = '2010 State Legislative District - Upper'
+    layer_name = '2010 State Legislative Districts - Upper'
+    collection_property = 'state_legislative_districts_upper_2010'
 
 
 class County(GeographicArea):
     """County"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'County'
+    __slots__ = ()
+
+    geography_type = 'County'
+    layer_name = 'Counties'
+    collection_property = 'counties'
 
 
 class ZCTA5(GeographicArea):
     """ZCTA5"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Zip Code Tabulation Area'
+    __slots__ = ()
+
+    geography_type = 'Zip Code Tabulation Area'
+    layer_name = 'ZIP Code Tabulation Areas'
+    collection_property = 'zcta5'
 
 
 class ZCTA_2010(ZCTA5):
     """2010 Zip Code Tabulation Areas"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2010 Census ZIP Code Tabulation Area'
+    __slots__ = ()
+
+    geography_type = '2010 Census ZIP Code Tabulation Area'
+    layer_name = '2010 Census ZIP Code Tabulation Areas'
+    collection_property = 'zcta_2010'
 
 
 class ZCTA_2020(ZCTA5):
     """2020 Zip Code Tabulation Areas"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2020 Census ZIP Code Tabulation Area'
+    __slots__ = ()
+
+    geography_type = '2020 Census ZIP Code Tabulation Area'
+    layer_name = '2020 Census ZIP Code Tabulation Areas'
+    collection_property = 'zcta_2020'
 
 
 class UnifiedSchoolDistrict(GeographicArea):
     """Unified School District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Unified School District'
+    __slots__ = ()
+
+    geography_type = 'Unified School District'
+    layer_name = 'Unified School Districts'
+    collection_property = 'unified_school_districts'
 
 
 class SecondarySchoolDistrict(GeographicArea):
     """Secondary School District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Secondary School District'
+    __slots__ = ()
+
+    geography_type = 'Secondary School District'
+    layer_name = 'Secondary School Districts'
+    collection_property = 'secondary_school_districts'
 
 
 class ElementarySchoolDistrict(GeographicArea):
     """Elementary School District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Elementary School District'
+    __slots__ = ()
+
+    geography_type = 'Elementary School District'
+    layer_name = 'Elementary School Districts'
+    collection_property = 'elementary_school_districts'
 
 
 class VotingDistrict(GeographicArea):
     """Voting District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'County'
+    __slots__ = ()
+
+    geography_type = 'Voting District'
+    layer_name = 'Voting Districts'
+    collection_property = 'voting_districts'
 
 
 class MetropolitanDivision(GeographicArea):
     """Metropolitan Division"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Metropolitan Division'
+    __slots__ = ()
+
+    geography_type = 'Metropolitan Division'
+    layer_name = 'Metropolitan Divisions'
+    collection_property = 'metropolitan_divisions'
 
 
 class State(GeographicArea):
     """State"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'State'
+    __slots__ = ()
+
+    geography_type = 'State'
+    layer_name = 'States'
+    collection_property = 'states'
 
 
 class CensusBlockGroup(GeographicArea):
     """Census Block Group"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Census Block Group'
+    __slots__ = ()
+
+    geography_type = 'Census Block Group'
+    layer_name = 'Census Block Groups'
+    collection_property = 'block_groups'
 
 
 class TribalCensusBlockGroup(CensusBlockGroup):
     """Tribal Census Block Group"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Tribal Census Block Group'
+    __slots__ = ()
+
+    geography_type = 'Tribal Census Block Group'
+    layer_name = 'Tribal Census Block Groups'
+    collection_property = 'tribal_block_groups'
 
 
 class CombinedStatisticalArea(GeographicArea):
     """Combined Statistical Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Combined Statistical Area'
+    __slots__ = ()
+
+    geography_type = 'Combined Statistical Area'
+    layer_name = 'Combined Statistical Areas'
+    collection_property = 'csa'
 
 
 class CountySubDivision(GeographicArea):
     """County Sub-division"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'County Sub-division'
+    __slots__ = ()
+
+    geography_type = 'County Sub-division'
+    layer_name = 'County Subdivisions'
+    collection_property = 'county_subdivisions'
 
 
 class TribalSubDivision(GeographicArea):
     """Tribal Sub-division"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Tribal Sub-division'
+    __slots__ = ()
+
+    geography_type = 'Tribal Sub-division'
+    layer_name = 'Tribal Subdivisions'
+    collection_property = 'tribal_subdivisions'
 
 
 class CensusDesignatedPlace(GeographicArea):
     """Census Designated Place"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Census Designated Place'
+    __slots__ = ()
+
+    geography_type = 'Census Designated Place'
+    layer_name = 'Census Designated Places'
+    collection_property = 'census_designated_places'
 
 
 class CensusDivision(GeographicArea):
     """Census Division"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Division'
+    __slots__ = ()
+
+    geography_type = 'Division'
+    layer_name = 'Census Divisions'
+    collection_property = 'divisions'
 
 
 class CongressionalDistrict(GeographicArea):
     """Congressional District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Congressional District'
+    __slots__ = ()
+
+    geography_type = 'Congressional District'
 
 
 class CongressionalDistrict_116(CongressionalDistrict):
     """116th Congressional District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '116th Congressional District'
+    __slots__ = ()
+
+    geography_type = '116th Congressional District'
+    layer_name = '116th Congressional Districts'
+    collection_property = 'congressional_districts_116'
 
 
 class CongressionalDistrict_115(CongressionalDistrict):
     """115th Congressional District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '115th Congressional District'
+    __slots__ = ()
+
+    geography_type = '115th Congressional District'
+    layer_name = '115th Congressional Districts'
+    collection_property = 'congressional_districts_115'
 
 
 class CongressionalDistrict_113(CongressionalDistrict):
     """113th Congressional District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '113th Congressional District'
+    __slots__ = ()
+
+    geography_type = '113th Congressional District'
+    layer_name = '113th Congressional Districts'
+    collection_property = 'congressional_districts_113'
 
 
 class CongressionalDistrict_111(CongressionalDistrict):
     """111th Congressional District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '111th Congressional District'
+    __slots__ = ()
+
+    geography_type = '111th Congressional District'
+    layer_name = '111th Congressional Districts'
+    collection_property = 'congressional_districts_111'
 
 
 class CensusRegion(GeographicArea):
     """Census Region"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Region'
+    __slots__ = ()
+
+    geography_type = 'Region'
+    layer_name = 'Census Regions'
+    collection_property = 'regions'
 
 
 class MetropolitanStatisticalArea(GeographicArea):
     """Metropolitan Statistical Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Metropolitan Statistical Area'
+    __slots__ = ()
+
+    geography_type = 'Metropolitan Statistical Area'
+    layer_name = 'Metropolitan Statistical Areas'
+    collection_property = 'msa'
 
 
 class MicropolitanStatisticalArea(GeographicArea):
     """Micropolitan Statistical Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Micropolitan Statistical Area'
+    __slots__ = ()
+
+    geography_type = 'Micropolitan Statistical Area'
+    layer_name = 'Micropolitan Statistical Areas'
+    collection_property = 'micropolitan_statistical_areas'
 
 
 class CensusBlock(GeographicArea):
     """Census Block"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Census Block'
+    __slots__ = ()
+
+    geography_type = 'Census Block'
+    layer_name = 'Census Blocks'
+    collection_property = 'blocks'
 
 
 class CensusBlock_2020(CensusBlock):
     """2020 Census Blocks"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2020 Census Block'
+    __slots__ = ()
+
+    geography_type = '2020 Census Block'
+    layer_name = '2020 Census Blocks'
+    collection_property = 'blocks_2020'
 
 
 class CensusTract(GeographicArea):
     """Census Tract"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Census Tract'
+    __slots__ = ()
+
+    geography_type = 'Census Tract'
+    layer_name = 'Census Tracts'
+    collection_property = 'tracts'
 
 
 class TribalCensusTract(CensusTract):
     """Tribal Census Tract"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Tribal Census Tract'
+    __slots__ = ()
+
+    geography_type = 'Tribal Census Tract'
+    layer_name = 'Tribal Census Tracts'
+    collection_property = 'tribal_tracts'
 
 
 class Estate(GeographicArea):
     """Estate"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Estate'
+    __slots__ = ()
+
+    geography_type = 'Estate'
+    layer_name = 'Estates'
+    collection_property = 'estates'
 
 
 class Subbarrio(GeographicArea):
     """Subbarrio"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Subbarrio'
+    __slots__ = ()
+
+    geography_type = 'Subbarrio'
+    layer_name = 'Subbarrios'
+    collection_property = 'subbarrios'
 
 
 class ConsolidatedCity(GeographicArea):
     """Consolidated City"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Consolidated City'
+    __slots__ = ()
+
+    geography_type = 'Consolidated City'
+    layer_name = 'Consolidated Cities'
+    collection_property = 'consolidated_cities'
 
 
 class IncorporatedPlace(GeographicArea):
     """Incorporated Place"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Incorporated Place'
+    __slots__ = ()
+
+    geography_type = 'Incorporated Place'
+    layer_name = 'Incorporated Places'
+    collection_property = 'incorporated_places'
 
 
 class ANRC(GeographicArea):
     """Alaska Native Regional Corporation"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Alaska Native Regional Corporation'
+    __slots__ = ()
+
+    geography_type = 'Alaska Native Regional Corporation'
+    layer_name = 'Alaska Native Regional Corporations'
+    collection_property = 'anrc'
 
 
 class FederalAmericanIndianReservation(GeographicArea):
     """Federal American Indian Reservation"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Federal American Indian Reservation'
+    __slots__ = ()
+
+    geography_type = 'Federal American Indian Reservation'
+    layer_name = 'Federal American Indian Reservations'
+    collection_property = 'federal_american_indian_reservations'
 
 
 class OffReservationTrustLand(GeographicArea):
     """Off-Reservation Trust Land"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Off-Reservation Trust Land'
+    __slots__ = ()
+
+    geography_type = 'Off-Reservation Trust Land'
+    layer_name = 'Off-Reservation Trust Lands'
+    collection_property = 'off_reservation_trust_lands'
 
 
 class StateAmericanIndianReservation(GeographicArea):
     """State American Indian Reservation"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'State American Indian Reservation'
+    __slots__ = ()
+
+    geography_type = 'State American Indian Reservation'
+    layer_name = 'State American Indian Reservations'
+    collection_property = 'state_american_indian_reservations'
 
 
 class HawaiianHomeLand(GeographicArea):
     """Hawaiian Home Land"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Hawaiian Home Land'
+    __slots__ = ()
+
+    geography_type = 'Hawaiian Home Land'
+    layer_name = 'Hawaiian Home Lands'
+    collection_property = 'hawaiian_home_lands'
 
 
 class ANVSA(GeographicArea):
     """Alaska Native Village Statistical Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Alaska Native Village Statistical Area'
+    __slots__ = ()
+
+    geography_type = 'Alaska Native Village Statistical Area'
+    layer_name = 'Alaska Native Village Statistical Areas'
+    collection_property = 'anvsa'
 
 
 class OTSA(GeographicArea):
     """Oklahoma Tribal Statistical Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Oklahoma Tribal Statistical Area'
+    __slots__ = ()
+
+    geography_type = 'Oklahoma Tribal Statistical Area'
+    layer_name = 'Oklahoma Tribal Statistical Areas'
+    collection_property = 'otsa'
 
 
 class SDTSA(GeographicArea):
     """State Designated Tribal Statistical Areas"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'State Designated Tribal Statistical Area'
+    __slots__ = ()
+
+    geography_type = 'State Designated Tribal Statistical Area'
+    layer_name = 'State Designated Tribal Statistical Areas'
+    collection_property = 'sdtsa'
 
 
 class TDSA(GeographicArea):
     """Tribal Designated Statistical Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Tribal Designated Statistical Area'
+    __slots__ = ()
+
+    geography_type = 'Tribal Designated Statistical Area'
+    layer_name = 'Tribal Designated Statistical Areas'
+    collection_property = 'tdsa'
 
 
 class AIJUA(GeographicArea):
     """American Indian Joint-Use Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'American Indian Joint-Use Area'
+    __slots__ = ()
+
+    geography_type = 'American Indian Joint-Use Area'
+    layer_name = 'American Indian Joint-Use Areas'
+    collection_property = 'american_indian_joint_use_areas'
 
 
 class CombinedNECTA(GeographicArea):
     """Combined New England City and Town Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Combined New England City and Town Area'
+    __slots__ = ()
+
+    geography_type = 'Combined New England City and Town Area'
+    layer_name = 'Combined New England City and Town Areas'
+    collection_property = 'combined_nectas'
 
 
 class NECTADivision(GeographicArea):
     """New England City and Town Area Division"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'New England City and Town Area Division'
+    __slots__ = ()
+
+    geography_type = 'New England City and Town Area Division'
+    layer_name = 'New England City and Town Area Divisions'
+    collection_property = 'necta_divisions'
 
 
 class MetropolitanNECTA(CombinedNECTA):
     """Metropolitan New England City and Town Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Metropolitan New England City and Town Area'
+    __slots__ = ()
+
+    geography_type = 'Metropolitan New England City and Town Area'
+    layer_name = 'Metropolitan New England City and Town Areas'
+    collection_property = 'metropolitan_nectas'
 
 
 class MicropolitanNECTA(CombinedNECTA):
     """Micropolitan New England City and Town Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Micropolitan New England City and Town Area'
+    __slots__ = ()
+
+    geography_type = 'Micropolitan New England City and Town Area'
+    layer_name = 'Micropolitan New England City and Town Areas'
+    collection_property = 'micropolitan_nectas'
 
 
 class UrbanGrowthArea(GeographicArea):
     """Urban Growth Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Urban Growth Area'
+    __slots__ = ()
+
+    geography_type = 'Urban Growth Area'
+    layer_name = 'Urban Growth Areas'
+    collection_property = 'urban_growth_areas'
 
 
 class UrbanizedArea(GeographicArea):
     """Urbanized Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Urbanized Area'
+    __slots__ = ()
+
+    geography_type = 'Urbanized Area'
+    layer_name = 'Urbanized Areas'
+    collection_property = 'urbanized_areas'
 
 
 class UrbanCluster(GeographicArea):
     """Urban Cluster"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Urban Cluster'
+    __slots__ = ()
+
+    geography_type = 'Urban Cluster'
+    layer_name = 'Urban Clusters'
+    collection_property = 'urban_clusters'
 
 
 class UrbanizedArea_2010(UrbanizedArea):
     """2010 Census Urbanized Area"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2010 Census Urbanized Area'
+    __slots__ = ()
+
+    geography_type = '2010 Census Urbanized Area'
+    layer_name = '2010 Census Urbanized Areas'
+    collection_property = 'urbanized_areas_2010'
 
 
 class UrbanCluster_2010(UrbanCluster):
     """2010 Census Urban Cluster"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return '2010 Census Urban Cluster'
+    __slots__ = ()
+
+    geography_type = '2010 Census Urban Cluster'
+    layer_name = '2010 Census Urban Clusters'
+    collection_property = 'urban_clusters_2010'
 
 
 class TrafficAnalysisDistrict(GeographicArea):
     """Traffic Analysis District"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Traffic Analysis District'
+    __slots__ = ()
+
+    geography_type = 'Traffic Analysis District'
+    layer_name = 'Traffic Analysis Districts'
+    collection_property = 'traffic_analysis_districts'
 
 
 class TrafficAnalysisZone(GeographicArea):
     """Traffic Analysis Zone"""
 
-    @property
-    def geography_type(self):
-        """Returns the Geography Type for the given geography."""
-        return 'Traffic Analysis Zone'
-
-
-# Key represents the ``geography_type`` returned by the Census Geocoder API.
-# Tuple contains the GeographyCollection property name and the GeographicArea sub-class.
-GEOGRAPHY_MAP = {
-    '2010 Census Public Use Microdata Areas': ('pumas_2010', PUMA_2010),
-    'Public Use Microdata Areas': ('pumas', PUMA),
-    'Census Regions': ('regions', CensusRegion),
-    'Census Divisions': ('divisions', CensusDivision),
-    'States': ('states', State),
-    'Counties': ('counties', County),
-    'County Subdivisions': ('county_subdivisions', CountySubDivision),
-    'Tribal Subdivisions': ('tribal_subdivisions', TribalSubDivision),
-    'Metropolitan Divisions': ('metropolitan_divisions', MetropolitanDivision),
-    '2010 Census ZIP Code Tabulation Areas': ('zcta_2010', ZCTA_2010),
-    '2020 ZIP code Tabulation Areas': ('zcta_2020', ZCTA_2020),
-    'ZIP Code Tabulation Areas': ('zcta5', ZCTA5),
-    'Zip Code Tabulation Areas': ('zcta5', ZCTA5),
-    'Unified School Districts': ('unified_school_districts', UnifiedSchoolDistrict),
-    'Secondary School Districts': ('secondary_school_districts', SecondarySchoolDistrict),
-    'Elementary School Districts': ('elementary_school_districts',
-                                    ElementarySchoolDistrict),
-    'Voting Districts': ('voting_districts', VotingDistrict),
-    'State Legislative Districts - Upper': ('state_legislative_districts_upper',
-                                            StateLegislativeDistrictUpper),
-    'State Legislative Districts - Lower': ('state_legislative_districts_lower',
-                                            StateLegislativeDistrictLower),
-    '2018 State Legislative Districts - Upper': ('state_legislative_districts_upper_2018',
-                                                 StateLegislativeDistrictUpper_2018),
-    '2018 State Legislative Districts - Lower': ('state_legislative_districts_lower_2018',
-                                                 StateLegislativeDistrictLower_2018),
-    '2016 State Legislative Districts - Upper': ('state_legislative_districts_upper_2016',
-                                                 StateLegislativeDistrictUpper_2016),
-    '2016 State Legislative Districts - Lower': ('state_legislative_districts_lower_2016',
-                                                 StateLegislativeDistrictLower_2016),
-    '2012 State Legislative Districts - Upper': ('state_legislative_districts_upper_2012',
-                                                 StateLegislativeDistrictUpper_2012),
-    '2012 State Legislative Districts - Lower': ('state_legislative_districts_lower_2012',
-                                                 StateLegislativeDistrictLower_2012),
-    '2010 State Legislative Districts - Upper': ('state_legislative_districts_upper_2010',
-                                                 StateLegislativeDistrictUpper_2010),
-    '2010 State Legislative Districts - Lower': ('state_legislative_districts_lower_2010',
-                                                 StateLegislativeDistrictLower_2010),
-    '116th Congressional Districts': ('congressional_districts_116',
-                                      CongressionalDistrict_116),
-    '115th Congressional Districts': ('congressional_districts_115',
-                                      CongressionalDistrict_115),
-    '113th Congressional Districts': ('congressional_districts_113',
-                                      CongressionalDistrict_113),
-    '111th Congressional Districts': ('congressional_districts_111',
-                                      CongressionalDistrict_111),
-    'Combined Statistical Areas': ('csa', CombinedStatisticalArea),
-    'Metropolitan Statistical Areas': ('msa', MetropolitanStatisticalArea),
-    'Micropolitan Statistical Areas': ('micropolitan_stastistical_areas',
-                                       MicropolitanStatisticalArea),
-    'Census Block Groups': ('block_groups', CensusBlockGroup),
-    'Tribal Census Block Groups': ('tribal_block_groups', TribalCensusBlockGroup),
-    'Census Blocks': ('blocks', CensusBlock),
-    '2020 Census Blocks': ('blocks_2020', CensusBlock_2020),
-    'Tribal Census Tracts': ('tribal_tracts', TribalCensusTract),
-    'Census Tracts': ('tracts', CensusTract),
-    'Census Designated Places': ('metrpolitan_nectas', CensusDesignatedPlace),
-    'Estates': ('estates', Estate),
-    'Subbarrios': ('subbarrios', Subbarrio),
-    'Consolidated Cities': ('consolidated_cities', ConsolidatedCity),
-    'Incorporated Places': ('incorporated_places', IncorporatedPlace),
-    'Alaska Native Regional Corporations': ('anrc', ANRC),
-    'Federal American Indian Reservations': ('federal_american_indian_reservations',
-                                             FederalAmericanIndianReservation),
-    'Off-Reservation Trust Lands': ('off_reservation_trust_lands',
-                                    OffReservationTrustLand),
-    'State American Indian Reservations': ('state_american_indian_reservations',
-                                           StateAmericanIndianReservation),
-    'Hawaiian Home Lands': ('hawaiian_home_lands', HawaiianHomeLand),
-    'Alaska Native Village Statistical Areas': ('anvsa', ANVSA),
-    'Oklahoma Tribal Statistical Areas': ('otsa', OTSA),
-    'State Designated Tribal Statistical Areas': ('sdtsa', SDTSA),
-    'Tribal Designated Statistical Areas': ('tdsa', TDSA),
-    'American Indian Joint-Use Areas': ('american_indian_joint_use_areas', AIJUA),
-    'Combined New England City and Town Areas': ('combined_nectas', CombinedNECTA),
-    'New England City and Town Area Divisions': ('necta_divisions', NECTADivision),
-    'Metropolitan New England City and Town Areas': ('metropolitan_nectas',
-                                                     MetropolitanNECTA),
-    'Micopolitan New England City and Town Areas': ('micropolitan_nectas',
-                                                    MicropolitanNECTA),
-    'Urban Growth Areas': ('urban_growth_areas', UrbanGrowthArea),
-    'Urbanized Areas': ('urbanized_areas', UrbanizedArea),
-    '2010 Census Urbanized Areas': ('urbanized_areas_2010', UrbanizedArea_2010),
-    'Urban Clusters': ('urban_clusters', UrbanCluster),
-    '2010 Census Urban Clusters': ('urban_clusters_2010', UrbanCluster_2010),
-    'Traffic Analysis Districts': ('traffic_analysis_districts', TrafficAnalysisDistrict),
-    'Traffic Analysis Zones': ('traffic_analysis_zones', TrafficAnalysisZone),
-}
+    __slots__ = ()
+
+    geography_type = 'Traffic Analysis Zone'
+    layer_name = 'Traffic Analysis Zones'
+    collection_property = 'traffic_analysis_zones'
+
+
+# Key represents the layer name returned by the Census Geocoder API. Tuple contains the
+# GeographyCollection property name and the GeographicArea sub-class. Populated by
+# GeographicArea.__init_subclass__() from each sub-class's ``layer_name`` and
+# ``collection_property``. Read-only, since the derived lookup tables below are built
+# from it once at import.
+GEOGRAPHY_MAP = MappingProxyType(_LAYER_REGISTRY)
+
+# GEOGRAPHY_MAP keyed by case-folded layer name, so that lookups tolerate the
+# inconsistent capitalization used by the Census Geocoder API.
+_GEOGRAPHY_LOOKUP = {key.casefold(): value for key, value in GEOGRAPHY_MAP.items()}
+
+# Each layer populates its own GeographyCollection property, so a property claimed by
+# two layers is a definition error rather than something to silently resolve.
+_PROPERTY_TO_CLASS = {}
+for _property_name, _target_cls in GEOGRAPHY_MAP.values():
+    if _property_name in _PROPERTY_TO_CLASS:
+        raise TypeError(
+            f'{_target_cls.__name__} and {_PROPERTY_TO_CLASS[_property_name].__name__} '
+            f'both declare collection_property "{_property_name}"'
+        )
+    _PROPERTY_TO_CLASS[_property_name] = _target_cls
+
+del _property_name, _target_cls
+
+# Layer property name to the name of the hidden slot holding its list.
+_HIDDEN_NAMES = {key: sys.intern(f'_{key}') for key in _PROPERTY_TO_CLASS}
+
+
+def lookup_geography(name):
+    """Return the :class:`GeographyCollection` property name and
+    :class:`GeographicArea` sub-class that correspond to the layer ``name``, ignoring
+    case.
+
+    :param name: The layer name, as returned by the `Census Geocoder API`_.
+    :type name: :class:`str <python:str>`
+
+    :returns: The property name and sub-class, or :obj:`None <python:None>` if
+      ``name`` is not recognized.
+    :rtype: :class:`tuple <python:tuple>` / :obj:`None <python:None>`
+
+    """
+    return _GEOGRAPHY_LOOKUP.get(name.casefold())
 
 
 def get_target_layer_cls(property_name):
@@ -1798,12 +1445,13 @@ def get_target_layer_cls(property_name):
     :rtype: class object of :class:`GeographicArea`
 
     """
-    for key in GEOGRAPHY_MAP:
-        tuple_object = GEOGRAPHY_MAP.get(key, None)
-        if tuple_object and tuple_object[0] == property_name:
-            return tuple_object[1]
+    target_cls = _PROPERTY_TO_CLASS.get(property_name)
+    if target_cls is None:
+        raise errors.CensusGeocoderError(
+            f'Property name "{property_name}" not recognized.'
+        )
 
-    raise errors.CensusGeocoderError(f'Property name "{property_name}" not recognized.')
+    return target_cls
 
 
 def validate_layer_values(value, property_name):
@@ -1820,103 +1468,77 @@ def validate_layer_values(value, property_name):
     """
     value = validators.iterable(value, allow_empty = False)
     target_cls = get_target_layer_cls(property_name)
-    validated_values = []
-    for item in value:
-        if not isinstance(item, target_cls):
-            item = validators.dict(value, allow_empty = False)
-            validated_value = target_cls.from_dict(item)
-            validated_values.append(validated_value)
-        else:
-            validated_values.append(item)
+    from_dict = target_cls.from_dict
 
-    return validated_values
+    return [item if item.__class__ is target_cls or isinstance(item, target_cls)
+            else from_dict(item if item.__class__ is dict and item
+                           else validators.dict(item, allow_empty = False))
+            for item in value]
 
 
-LAYER_PROPERTIES = [GEOGRAPHY_MAP.get(x)[0] for x in GEOGRAPHY_MAP]
+LAYER_PROPERTIES = tuple(value[0] for value in GEOGRAPHY_MAP.values())
 
 
 class GeographyCollection(metaclasses.BaseEntity):
     """Collection of :class:`GeographicArea` objects."""
 
-    def __init__(self, **kwargs):
-        self._pumas_2010 = []
-        self._pumas = []
-        self._regions = []
-        self._divisions = []
-        self._states = []
-        self._counties = []
-        self._county_subdivisions = []
-        self._tribal_subdivisions = []
-        self._metropolitan_divisions = []
-        self._zcta5 = []
-        self._zcta_2020 = []
-        self._zcta_2010 = []
-        self._unified_school_districts = []
-        self._secondary_school_districts = []
-        self._elementary_school_districts = []
-        self._voting_districts = []
-        self._state_legislative_districts_upper = []
-        self._state_legislative_districts_lower = []
-        self._state_legislative_districts_upper_2018 = []
-        self._state_legislative_districts_lower_2018 = []
-        self._state_legislative_districts_upper_2016 = []
-        self._state_legislative_districts_lower_2016 = []
-        self._state_legislative_districts_upper_2012 = []
-        self._state_legislative_districts_lower_2012 = []
-        self._state_legislative_districts_upper_2010 = []
-        self._state_legislative_districts_lower_2010 = []
-        self._congressional_districts_116 = []
-        self._congressional_districts_115 = []
-        self._congressional_districts_113 = []
-        self._congressional_districts_111 = []
-        self._csa = []
-        self._msa = []
-        self._block_groups = []
-        self._blocks = []
-        self._blocks_2020 = []
-        self._tracts = []
-        self._tribal_tracts = []
-        self._tribal_block_groups = []
-        self._metrpolitan_nectas = []
-        self._estates = []
-        self._subbarrios = []
-        self._consolidated_cities = []
-        self._incorporated_places = []
-        self._anrc = []
-        self._federal_american_indian_reservations = []
-        self._off_reservation_trust_lands = []
-        self._state_american_indian_reservations = []
-        self._hawaiian_home_lands = []
-        self._anvsa = []
-        self._otsa = []
-        self._sdtsa = []
-        self._tdsa = []
-        self._american_indian_joint_use_areas = []
-        self._combined_nectas = []
-        self._necta_divisions = []
-        self._metropolitan_nectas = []
-        self._micropolitan_nectas = []
-        self._urban_growth_areas = []
-        self._urbanized_areas = []
-        self._urbanized_areas_2010 = []
-        self._urban_clusters = []
-        self._urban_clusters_2010 = []
-        self._traffic_analysis_districts = []
-        self._traffic_analysis_zones = []
+    __slots__ = ('_pumas_2010', '_pumas', '_regions', '_divisions', '_states',
+                 '_counties', '_county_subdivisions', '_tribal_subdivisions',
+                 '_metropolitan_divisions', '_zcta5', '_zcta_2020', '_zcta_2010',
+                 '_unified_school_districts', '_secondary_school_districts',
+                 '_elementary_school_districts', '_voting_districts',
+                 '_state_legislative_districts_upper',
+                 '_state_legislative_districts_lower',
+                 '_state_legislative_districts_upper_2018',
+                 '_state_legislative_districts_lower_2018',
+                 '_state_legislative_districts_upper_2016',
+                 '_state_legislative_districts_lower_2016',
+                 '_state_legislative_districts_upper_2012',
+                 '_state_legislative_districts_lower_2012',
+                 '_state_legislative_districts_upper_2010',
+                 '_state_legislative_districts_lower_2010',
+                 '_congressional_districts_116', '_congressional_districts_115',
+                 '_congressional_districts_113', '_congressional_districts_111', '_csa',
+                 '_msa', '_block_groups', '_blocks', '_blocks_2020', '_tracts',
+                 '_tribal_tracts', '_tribal_block_groups', '_census_designated_places',
+                 '_estates', '_subbarrios', '_consolidated_cities',
+                 '_incorporated_places', '_anrc',
+                 '_federal_american_indian_reservations',
+                 '_off_reservation_trust_lands', '_state_american_indian_reservations',
+                 '_hawaiian_home_lands', '_anvsa', '_otsa', '_sdtsa', '_tdsa',
+                 '_american_indian_joint_use_areas', '_combined_nectas',
+                 '_necta_divisions', '_metropolitan_nectas', '_micropolitan_nectas',
+                 '_urban_growth_areas', '_urbanized_areas', '_urbanized_areas_2010',
+                 '_urban_clusters', '_urban_clusters_2010',
+                 '_traffic_analysis_districts', '_traffic_analysis_zones',
+                 '_micropolitan_statistical_areas', '_assigned_layers')
+
+    _LAYER_SLOTS = frozenset(__slots__[:-1])
+
+    entity_type = 'collection'
 
+    def __init__(self, **kwargs):
+        # Names of the layer slots that currently hold a list. Unassigned layers are
+        # empty, so __len__ only needs to visit these.
+        self._assigned_layers = set()
         if kwargs:
             self = self.from_dict(kwargs)
 
-    def __len__(self):
-        cls = self.__class__
-        potential_properties = [x for x in dir(cls)
-                                if not x.startswith('_')]
-        result = 0
-        for item in potential_properties:
-            if checkers.is_type(getattr(cls, item), 'property'):
-                result += len(getattr(self, item))
+    def __getattr__(self, name):
+        # Layer lists are only allocated when first accessed, since most responses
+        # populate just a few of them.
+        if name in self._LAYER_SLOTS:
+            value = []
+            setattr(self, name, value)
+            self._assigned_layers.add(name)
+            return value
 
-        return result
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __len__(self):
+        return sum(len(getattr(self, name)) for name in self._assigned_layers)
 
     def _set_hidden_property(self, value, property_name):
         """Validates ``value`` and sets the correpsonding hidden property for the
@@ -1929,854 +1551,466 @@ class GeographyCollection(metaclasses.BaseEntity):
         :type property_name: :class:`str <python:str>`
 
         """
+        # validate_layer_values() always builds a new list, so it can be stored as-is.
         values = validate_layer_values(value, property_name)
-        attr_target = f'_{property_name}'
+        attr_target = _HIDDEN_NAMES[property_name]
+        setattr(self, attr_target, values)
+        self._assigned_layers.add(attr_target)
 
-        if not values:
-            setattr(self, attr_target, [])
-        else:
-            setattr(self, attr_target, [x for x in values])
-
-    @property
-    def pumas_2010(self):
-        """2010 Census Public Use Microdata Areas
+    pumas_2010 = metaclasses.LayerField(
+        doc = """2010 Census Public Use Microdata Areas
 
         :rtype: :class:`list <python:list>` of :class:`PUMA_2010`
         """
-        return self._pumas_2010
+    )
 
-    @pumas_2010.setter
-    def pumas_2010(self, value):
-        property_name = currentframe().f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def pumas(self):
-        """Public Use Microdata Areas
+    pumas = metaclasses.LayerField(
+        doc = """Public Use Microdata Areas
 
         :rtype: :class:`list <python:list>` of :class:`PUMA`
         """
-        return self._pumas
+    )
 
-    @pumas.setter
-    def pumas(self, value):
-        property_name = currentframe().f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def regions(self):
-        """Census Regions
+    regions = metaclasses.LayerField(
+        doc = """Census Regions
 
         :rtype: :class:`list <python:list>` of :class:`CensusRegion`
         """
-        return self._regions
+    )
 
-    @regions.setter
-    def regions(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def divisions(self):
-        """Census Divisions
+    divisions = metaclasses.LayerField(
+        doc = """Census Divisions
 
         :rtype: :class:`list <python:list>` of :class:`CensusDivision`
         """
-        return self._divisions
-
-    @divisions.setter
-    def divisions(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def states(self):
-        """States
+    states = metaclasses.LayerField(
+        doc = """States
 
         :rtype: :class:`list <python:list>` of :class:`State`
         """
-        return self._states
+    )
 
-    @states.setter
-    def states(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def counties(self):
-        """Census Counties
+    counties = metaclasses.LayerField(
+        doc = """Census Counties
 
         :rtype: :class:`list <python:list>` of :class:`County`
         """
-        return self._counties
+    )
 
-    @counties.setter
-    def counties(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def county_subdivisions(self):
-        """County Sub-division
+    county_subdivisions = metaclasses.LayerField(
+        doc = """County Sub-division
 
         :rtype: :class:`list <python:list>` of :class:`CountySubDivision`
         """
-        return self._county_subdivisions
+    )
 
-    @county_subdivisions.setter
-    def county_subdivisions(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def tribal_subdivisions(self):
-        """Tribal Sub-divisions
+    tribal_subdivisions = metaclasses.LayerField(
+        doc = """Tribal Sub-divisions
 
         :rtype: :class:`list <python:list>` of :class:`TribalSubDivision`
         """
-        return self._tribal_subdivisions
+    )
 
-    @tribal_subdivisions.setter
-    def tribal_subdivisions(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def metropolitan_divisions(self):
-        """Metropolitan Divisions
+    metropolitan_divisions = metaclasses.LayerField(
+        doc = """Metropolitan Divisions
 
         :rtype: :class:`list <python:list>` of :class:`MetropolitanDivision`
         """
-        return self._metropolitan_divisions
-
-    @metropolitan_divisions.setter
-    def metropolitan_divisions(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def zcta_2010(self):
-        """2010 Census ZIP Code Tabulation Areas
+    zcta_2010 = metaclasses.LayerField(
+        doc = """2010 Census ZIP Code Tabulation Areas
 
         :rtype: :class:`list <python:list>` of :class:`ZCTA_2010`
         """
-        return self._zcta_2010
+    )
 
-    @zcta_2010.setter
-    def zcta_2010(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def zcta_2020(self):
-        """2020 Census ZIP Code Tabulation Areas
+    zcta_2020 = metaclasses.LayerField(
+        doc = """2020 Census ZIP Code Tabulation Areas
 
         :rtype: :class:`list <python:list>` of :class:`ZCTA_2020`
         """
-        return self._zcta_2020
+    )
 
-    @zcta_2020.setter
-    def zcta_2020(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def zcta5(self):
-        """Zip Code Tabulation Area
+    zcta5 = metaclasses.LayerField(
+        doc = """Zip Code Tabulation Area
 
         :rtype: :class:`list <python:list>` of :class:`ZCTA5`
         """
-        return self._zcta5
+    )
 
-    @zcta5.setter
-    def zcta5(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def unified_school_districts(self):
-        """Unified School Districts
+    unified_school_districts = metaclasses.LayerField(
+        doc = """Unified School Districts
 
         :rtype: :class:`list <python:list>` of :class:`UnifiedSchoolDistrict`
         """
-        return self._unified_school_districts
+    )
 
-    @unified_school_districts.setter
-    def unified_school_districts(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def secondary_school_districts(self):
-        """Secondary School Districts
+    secondary_school_districts = metaclasses.LayerField(
+        doc = """Secondary School Districts
 
         :rtype: :class:`list <python:list>` of :class:`SecondarySchoolDistrict`
         """
-        return self._secondary_school_districts
+    )
 
-    @secondary_school_districts.setter
-    def secondary_school_districts(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def elementary_school_districts(self):
-        """Elementary School Districts
+    elementary_school_districts = metaclasses.LayerField(
+        doc = """Elementary School Districts
 
         :rtype: :class:`list <python:list>` of :class:`ElementarySchoolDistrict`
         """
-        return self._elementary_school_districts
-
-    @elementary_school_districts.setter
-    def elementary_school_districts(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def voting_districts(self):
-        """Voting Districts
+    voting_districts = metaclasses.LayerField(
+        doc = """Voting Districts
 
         :rtype: :class:`list <python:list>` of :class:`VotingDistrict`
         """
-        return self._voting_districts
-
-    @voting_districts.setter
-    def voting_districts(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def state_legislative_districts_upper(self):
-        """State Legislative Districts - Upper
+    state_legislative_districts_upper = metaclasses.LayerField(
+        doc = """State Legislative Districts - Upper
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictUpper`
         """
-        return self._state_legislative_districts_upper
+    )
 
-    @state_legislative_districts_upper.setter
-    def state_legislative_districts_upper(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def state_legislative_districts_lower(self):
-        """State Legislative Districts - Lower
+    state_legislative_districts_lower = metaclasses.LayerField(
+        doc = """State Legislative Districts - Lower
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictLower`
         """
-        return self._state_legislative_districts_lower
+    )
 
-    @state_legislative_districts_lower.setter
-    def state_legislative_districts_lower(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def state_legislative_districts_upper_2018(self):
-        """2018 State Legislative Districts - Upper
+    state_legislative_districts_upper_2018 = metaclasses.LayerField(
+        doc = """2018 State Legislative Districts - Upper
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictUpper_2018`
         """
-        return self._state_legislative_districts_upper_2018
+    )
 
-    @state_legislative_districts_upper_2018.setter
-    def state_legislative_districts_upper(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def state_legislative_districts_lower_2018(self):
-        """2018 State Legislative Districts - Lower
+    state_legislative_districts_lower_2018 = metaclasses.LayerField(
+        doc = """2018 State Legislative Districts - Lower
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictLower_2018`
         """
-        return self._state_legislative_districts_lower_2018
-
-    @state_legislative_districts_lower_2018.setter
-    def state_legislative_districts_lower_2018(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def state_legislative_districts_upper_2016(self):
-        """2016 State Legislative Districts - Upper
+    state_legislative_districts_upper_2016 = metaclasses.LayerField(
+        doc = """2016 State Legislative Districts - Upper
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictUpper_2016`
         """
-        return self._state_legislative_districts_upper_2016
-
-    @state_legislative_districts_upper_2016.setter
-    def state_legislative_districts_upper(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def state_legislative_districts_lower_2016(self):
-        """2016 State Legislative Districts - Lower
+    state_legislative_districts_lower_2016 = metaclasses.LayerField(
+        doc = """2016 State Legislative Districts - Lower
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictLower_2016`
         """
-        return self._state_legislative_districts_lower_2016
+    )
 
-    @state_legislative_districts_lower_2016.setter
-    def state_legislative_districts_lower_2016(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def state_legislative_districts_upper_2012(self):
-        """2012 State Legislative Districts - Upper
+    state_legislative_districts_upper_2012 = metaclasses.LayerField(
+        doc = """2012 State Legislative Districts - Upper
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictUpper_2012`
         """
-        return self._state_legislative_districts_upper_2012
+    )
 
-    @state_legislative_districts_upper_2012.setter
-    def state_legislative_districts_upper(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def state_legislative_districts_lower_2012(self):
-        """2012 State Legislative Districts - Lower
+    state_legislative_districts_lower_2012 = metaclasses.LayerField(
+        doc = """2012 State Legislative Districts - Lower
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictLower_2012`
         """
-        return self._state_legislative_districts_lower_2012
+    )
 
-    @state_legislative_districts_lower_2012.setter
-    def state_legislative_districts_lower_2012(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def state_legislative_districts_upper_2010(self):
-        """2010 State Legislative Districts - Upper
+    state_legislative_districts_upper_2010 = metaclasses.LayerField(
+        doc = """2010 State Legislative Districts - Upper
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictUpper_2010`
         """
-        return self._state_legislative_districts_upper_2010
-
-    @state_legislative_districts_upper_2010.setter
-    def state_legislative_districts_upper(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def state_legislative_districts_lower_2010(self):
-        """2010 State Legislative Districts - Lower
+    state_legislative_districts_lower_2010 = metaclasses.LayerField(
+        doc = """2010 State Legislative Districts - Lower
 
         :rtype: :class:`list <python:list>` of :class:`StateLegislativeDistrictLower_2010`
         """
-        return self._state_legislative_districts_lower_2010
-
-    @state_legislative_districts_lower_2010.setter
-    def state_legislative_districts_lower_2010(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def congressional_districts_116(self):
-        """116th Congressional Districts
+    congressional_districts_116 = metaclasses.LayerField(
+        doc = """116th Congressional Districts
 
         :rtype: :class:`list <python:list>` of :class:`CongressionalDistrict_116`
         """
-        return self._congressional_districts_116
+    )
 
-    @congressional_districts_116.setter
-    def congressional_districts_116(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def congressional_districts_115(self):
-        """115th Congressional Districts
+    congressional_districts_115 = metaclasses.LayerField(
+        doc = """115th Congressional Districts
 
         :rtype: :class:`list <python:list>` of :class:`CongressionalDistrict_115`
         """
-        return self._congressional_districts_115
+    )
 
-    @congressional_districts_115.setter
-    def congressional_districts_115(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def congressional_districts_113(self):
-        """113th Congressional Districts
+    congressional_districts_113 = metaclasses.LayerField(
+        doc = """113th Congressional Districts
 
         :rtype: :class:`list <python:list>` of :class:`CongressionalDistrict_113`
         """
-        return self._congressional_districts_113
+    )
 
-    @congressional_districts_113.setter
-    def congressional_districts_113(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def congressional_districts_111(self):
-        """111th Congressional Districts
+    congressional_districts_111 = metaclasses.LayerField(
+        doc = """111th Congressional Districts
 
         :rtype: :class:`list <python:list>` of :class:`CongressionalDistrict_111`
         """
-        return self._congressional_districts_111
+    )
 
-    @congressional_districts_111.setter
-    def congressional_districts_111(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def csa(self):
-        """Combined Statistical Areas
+    csa = metaclasses.LayerField(
+        doc = """Combined Statistical Areas
 
         :rtype: :class:`list <python:list>` of :class:`CombinedStatisticalArea`
         """
-        return self._csa
+    )
 
-    @csa.setter
-    def csa(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    micropolitan_statistical_areas = metaclasses.LayerField(
+        doc = """Micropolitan Statistical Areas
 
-    @property
-    def msa(self):
-        """Metropolitan Statistical Area
+        :rtype: :class:`list <python:list>` of :class:`MicropolitanStatisticalArea`
+        """
+    )
+
+    msa = metaclasses.LayerField(
+        doc = """Metropolitan Statistical Area
 
         :rtype: :class:`list <python:list>` of :class:`MetropolitanStatisticalArea`
         """
-        return self._msa
+    )
 
-    @msa.setter
-    def msa(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def block_groups(self):
-        """Census Block Groups
+    block_groups = metaclasses.LayerField(
+        doc = """Census Block Groups
 
         :rtype: :class:`list <python:list>` of :class:`CensusBlockGroup`
         """
-        return self._block_groups
+    )
 
-    @block_groups.setter
-    def block_groups(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def tribal_block_groups(self):
-        """Tribal Census Block Groups
+    tribal_block_groups = metaclasses.LayerField(
+        doc = """Tribal Census Block Groups
 
         :rtype: :class:`list <python:list>` of :class:`TribalCensusBlockGroup`
         """
-        return self._tribal_block_groups
-
-    @tribal_block_groups.setter
-    def tribal_block_groups(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def blocks(self):
-        """Census Blocks
+    blocks = metaclasses.LayerField(
+        doc = """Census Blocks
 
         :rtype: :class:`list <python:list>` of :class:`CensusBlock`
         """
-        return self._blocks
-
-    @blocks.setter
-    def blocks(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def blocks_2020(self):
-        """2020 Census Blocks
+    blocks_2020 = metaclasses.LayerField(
+        doc = """2020 Census Blocks
 
         :rtype: :class:`list <python:list>` of :class:`CensusBlock_2020`
         """
-        return self._blocks
+    )
 
-    @blocks_2020.setter
-    def blocks_2020(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def tracts(self):
-        """Census Tracts
+    tracts = metaclasses.LayerField(
+        doc = """Census Tracts
 
         :rtype: :class:`list <python:list>` of :class:`CensusTract`
         """
-        return self._tracts
+    )
 
-    @tracts.setter
-    def tracts(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def tribal_tracts(self):
-        """Tribal Census Tracts
+    tribal_tracts = metaclasses.LayerField(
+        doc = """Tribal Census Tracts
 
         :rtype: :class:`list <python:list>` of :class:`TribalCensusTract`
         """
-        return self._tribal_tracts
+    )
 
-    @tribal_tracts.setter
-    def tribal_tracts(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def metrpolitan_nectas(self):
-        """Census Designated Places
+    census_designated_places = metaclasses.LayerField(
+        doc = """Census Designated Places
 
         :rtype: :class:`list <python:list>` of :class:`CensusDesignatedPlace`
         """
-        return self._metrpolitan_nectas
-
-    @metrpolitan_nectas.setter
-    def metrpolitan_nectas(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def estates(self):
-        """Estates
+    estates = metaclasses.LayerField(
+        doc = """Estates
 
         :rtype: :class:`list <python:list>` of :class:`Estate`
         """
-        return self._estates
-
-    @estates.setter
-    def estates(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def subbarrios(self):
-        """Sub-barrios
+    subbarrios = metaclasses.LayerField(
+        doc = """Sub-barrios
 
         :rtype: :class:`list <python:list>` of :class:`Subbarrio`
         """
-        return self._subbarrios
+    )
 
-    @subbarrios.setter
-    def subbarrios(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def consolidated_cities(self):
-        """Consolidated Cities
+    consolidated_cities = metaclasses.LayerField(
+        doc = """Consolidated Cities
 
         :rtype: :class:`list <python:list>` of :class:`ConsolidatedCity`
         """
-        return self._consolidated_cities
+    )
 
-    @consolidated_cities.setter
-    def consolidated_cities(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def incorporated_places(self):
-        """Incorporated Places
+    incorporated_places = metaclasses.LayerField(
+        doc = """Incorporated Places
 
         :rtype: :class:`list <python:list>` of :class:`IncorporatedPlace`
         """
-        return self._incorporated_places
+    )
 
-    @incorporated_places.setter
-    def incorporated_places(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def anrc(self):
-        """Alaska Native Regional Corporations
+    anrc = metaclasses.LayerField(
+        doc = """Alaska Native Regional Corporations
 
         :rtype: :class:`list <python:list>` of :class:`ANRC`
         """
-        return self._anrc
-
-    @anrc.setter
-    def anrc(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def federal_american_indian_reservations(self):
-        """Federal American Indian Reservations
+    federal_american_indian_reservations = metaclasses.LayerField(
+        doc = """Federal American Indian Reservations
 
         :rtype: :class:`list <python:list>` of :class:`FederalAmericanIndianReservation`
         """
-        return self._federal_american_indian_reservations
-
-    @federal_american_indian_reservations.setter
-    def federal_american_indian_reservations(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def off_reservation_trust_lands(self):
-        """Off-Reservation Trust Lands
+    off_reservation_trust_lands = metaclasses.LayerField(
+        doc = """Off-Reservation Trust Lands
 
         :rtype: :class:`list <python:list>` of :class:`OffReservationTrustLand`
         """
-        return self._off_reservation_trust_lands
+    )
 
-    @off_reservation_trust_lands.setter
-    def off_reservation_trust_lands(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def state_american_indian_reservations(self):
-        """State American Indian Reservation
+    state_american_indian_reservations = metaclasses.LayerField(
+        doc = """State American Indian Reservation
 
         :rtype: :class:`list <python:list>` of :class:`StateAmericanIndianReservation`
         """
-        return self._state_american_indian_reservations
+    )
 
-    @state_american_indian_reservations.setter
-    def state_american_indian_reservations(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def hawaiian_home_lands(self):
-        """Hawaiian Home Lands
+    hawaiian_home_lands = metaclasses.LayerField(
+        doc = """Hawaiian Home Lands
 
         :rtype: :class:`list <python:list>` of :class:`HawaiianHomeLand`
         """
-        return self._hawaiian_home_lands
+    )
 
-    @hawaiian_home_lands.setter
-    def hawaiian_home_lands(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def anvsa(self):
-        """Alaska Native Village Statistical Area
+    anvsa = metaclasses.LayerField(
+        doc = """Alaska Native Village Statistical Area
 
         :rtype: :class:`list <python:list>` of :class:`ANVSA`
         """
-        return self._anvsa
+    )
 
-    @anvsa.setter
-    def anvsa(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def otsa(self):
-        """Oklahoma Tribal Statistical Areas
+    otsa = metaclasses.LayerField(
+        doc = """Oklahoma Tribal Statistical Areas
 
         :rtype: :class:`list <python:list>` of :class:`OTSA`
         """
-        return self._otsa
-
-    @otsa.setter
-    def otsa(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def sdtsa(self):
-        """State Designated Tribal Statistical Areas
+    sdtsa = metaclasses.LayerField(
+        doc = """State Designated Tribal Statistical Areas
 
         :rtype: :class:`list <python:list>` of :class:`SDTSA`
         """
-        return self._sdtsa
-
-    @sdtsa.setter
-    def sdtsa(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def tdsa(self):
-        """Tribal Designated Statistical Areas
+    tdsa = metaclasses.LayerField(
+        doc = """Tribal Designated Statistical Areas
 
         :rtype: :class:`list <python:list>` of :class:`TDSA`
         """
-        return self._tdsa
-
-    @tdsa.setter
-    def tdsa(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def american_indian_joint_use_areas(self):
-        """American Indian Joint-Use Areas
+    american_indian_joint_use_areas = metaclasses.LayerField(
+        doc = """American Indian Joint-Use Areas
 
         :rtype: :class:`list <python:list>` of :class:`AIJUA`
         """
-        return self._american_indian_joint_use_areas
+    )
 
-    @american_indian_joint_use_areas.setter
-    def american_indian_joint_use_areas(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def combined_nectas(self):
-        """Combined New England City and Town Areas
+    combined_nectas = metaclasses.LayerField(
+        doc = """Combined New England City and Town Areas
 
         :rtype: :class:`list <python:list>` of :class:`CombinedNECTA`
         """
-        return self._combined_nectas
+    )
 
-    @combined_nectas.setter
-    def combined_nectas(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def necta_divisions(self):
-        """New England City and Town Area Divisions
+    necta_divisions = metaclasses.LayerField(
+        doc = """New England City and Town Area Divisions
 
         :rtype: :class:`list <python:list>` of :class:`NECTADivision`
         """
-        return self._necta_divisions
+    )
 
-    @necta_divisions.setter
-    def necta_divisions(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def metrpolitan_nectas(self):
-        """Metropolitan New England City and Town Areas
+    metropolitan_nectas = metaclasses.LayerField(
+        doc = """Metropolitan New England City and Town Areas
 
         :rtype: :class:`list <python:list>` of :class:`MetropolitanNECTA`
         """
-        return self._metrpolitan_nectas
-
-    @metrpolitan_nectas.setter
-    def metrpolitan_nectas(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def micropolitan_nectas(self):
-        """Micropolitan New England City and Town Areas
+    micropolitan_nectas = metaclasses.LayerField(
+        doc = """Micropolitan New England City and Town Areas
 
         :rtype: :class:`list <python:list>` of :class:`MicropolitanNECTA`
         """
-        return self._micropolitan_nectas
-
-    @micropolitan_nectas.setter
-    def micropolitan_nectas(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def urban_growth_areas(self):
-        """Urban Growth Areas
+    urban_growth_areas = metaclasses.LayerField(
+        doc = """Urban Growth Areas
 
         :rtype: :class:`list <python:list>` of :class:`UrbanGrowthArea`
         """
-        return self._urban_growth_areas
+    )
 
-    @urban_growth_areas.setter
-    def urban_growth_areas(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def urbanized_areas(self):
-        """Urbanized Areas
+    urbanized_areas = metaclasses.LayerField(
+        doc = """Urbanized Areas
 
         :rtype: :class:`list <python:list>` of :class:`UrbanizedArea`
         """
-        return self._urbanized_areas
+    )
 
-    @urbanized_areas.setter
-    def urbanized_areas(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def urbanized_areas_2010(self):
-        """2010 Census Urbanized Areas
+    urbanized_areas_2010 = metaclasses.LayerField(
+        doc = """2010 Census Urbanized Areas
 
         :rtype: :class:`list <python:list>` of :class:`UrbanizedArea_2010`
         """
-        return self._urbanized_areas_2010
+    )
 
-    @urbanized_areas_2010.setter
-    def urbanized_areas_2010(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def urban_clusters(self):
-        """Urban Clusters
+    urban_clusters = metaclasses.LayerField(
+        doc = """Urban Clusters
 
         :rtype: :class:`list <python:list>` of :class:`UrbanCluster`
         """
-        return self._urban_clusters
+    )
 
-    @urban_clusters.setter
-    def urban_clusters(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def urban_clusters_2010(self):
-        """2010 Census Urban Clusters
+    urban_clusters_2010 = metaclasses.LayerField(
+        doc = """2010 Census Urban Clusters
 
         :rtype: :class:`list <python:list>` of :class:`urban_clusters_2010`
         """
-        return self._urban_clusters_2010
-
-    @urban_clusters_2010.setter
-    def urban_clusters_2010(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
+    )
 
-    @property
-    def traffic_analysis_districts(self):
-        """Traffic Analysis Districts
+    traffic_analysis_districts = metaclasses.LayerField(
+        doc = """Traffic Analysis Districts
 
         :rtype: :class:`list <python:list>` of :class:`TrafficAnalysisDistrict`
         """
-        return self._traffic_analysis_districts
+    )
 
-    @traffic_analysis_districts.setter
-    def traffic_analysis_districts(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def traffic_analysis_zones(self):
-        """Traffic Analysis Zones
+    traffic_analysis_zones = metaclasses.LayerField(
+        doc = """Traffic Analysis Zones
 
         :rtype: :class:`list <python:list>` of :class:`TrafficAnalysisZone`
         """
-        return self._traffic_analysis_zones
-
-    @traffic_analysis_zones.setter
-    def traffic_analysis_zones(self, value):
-        property_name = currentframe().f_back.f_code.co_name
-        self._set_hidden_property(value, property_name)
-
-    @property
-    def entity_type(self):
-        """The type of geographic entity that the object represents. Supports either:
-        ``locations`` or ``geographies``.
-
-        :rtype: :class:`str <python:str>`
-        """
-        return 'collection'
+    )
 
     @classmethod
     def from_dict(cls, as_dict):
@@ -2791,22 +2025,24 @@ class GeographyCollection(metaclasses.BaseEntity):
         :rtype: :class:`GeographicEntity`
 
         """
-        as_dict = validators.dict(as_dict)
-        result = cls()
+        if as_dict.__class__ is not dict or not as_dict:
+            as_dict = validators.dict(as_dict)
 
-        for key in GEOGRAPHY_MAP:
-            geographies = as_dict.get(key, None)
-            if not geographies:
-                break
+        result = cls()
+        assigned_layers = result._assigned_layers
 
-            geography_tuple = GEOGRAPHY_MAP.get(key, None)
-            if not geography_tuple:
+        for key, geographies in as_dict.items():
+            geography_tuple = lookup_geography(key)
+            if not geographies or not geography_tuple:
                 continue
 
-            attr_target = geography_tuple[0]
-            target_cls = geography_tuple[1]
-
-            setattr(result, attr_target, [target_cls.from_dict(x) for x in geographies])
+            property_name, target_cls = geography_tuple
+            attr_target = _HIDDEN_NAMES[property_name]
+            from_dict = target_cls.from_dict
+            setattr(result,
+                    attr_target,
+                    [from_dict(x) for x in validators.iterable(geographies)])
+            assigned_layers.add(attr_target)
 
         return result
 
@@ -2835,9 +2071,11 @@ class GeographyCollection(metaclasses.BaseEntity):
         :rtype: :class:`dict <python:dict>`
         """
         result = {}
-        for key in GEOGRAPHY_MAP:
-            geography_tuple = GEOGRAPHY_MAP.get(key)
-            attr_target = geography_tuple[0]
+        assigned_layers = self._assigned_layers
+        for key, geography_tuple in GEOGRAPHY_MAP.items():
+            attr_target = _HIDDEN_NAMES[geography_tuple[0]]
+            if attr_target not in assigned_layers:
+                continue
 
             geographies = getattr(self, attr_target)
 
@@ -2845,3 +2083,16 @@ class GeographyCollection(metaclasses.BaseEntity):
                 result[key] = [x.to_dict() for x in geographies]
 
         return result
+
+
+GeographyCollection._PROPERTY_NAMES = tuple(
+    name for name, member in vars(GeographyCollection).items()
+    if isinstance(member, metaclasses.LayerField)
+)
+
+_missing_layers = set(_PROPERTY_TO_CLASS).difference(GeographyCollection._PROPERTY_NAMES)
+if _missing_layers:
+    raise TypeError(f'GeographyCollection does not define layer properties for: '
+                    f'{", ".join(sorted(_missing_layers))}')
+
+del _missing_layers
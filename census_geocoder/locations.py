@@ -6,6 +6,9 @@ census_geocoder/locations.py
 Defines :class:`Location` and :class:`MatchedAddress` geographic entities.
 
 """
+from itertools import compress
+from operator import attrgetter
+
 from validator_collection import validators, checkers
 
 from census_geocoder import metaclasses, geographies, constants
@@ -14,6 +17,55 @@ from census_geocoder import metaclasses, geographies, constants
 class MatchedAddress(metaclasses.BaseEntity):
     """Represents a matched address returned by the US Census GeoCoder API."""
 
+    __slots__ = ('_tigerline_side', '_tigerline_id', '_latitude', '_longitude',
+                 '_address', '_from_address', '_to_address', '_street', '_pre_type',
+                 '_pre_direction', '_pre_qualifier', '_suffix_type',
+                 '_suffix_direction', '_suffix_qualifier', '_city', '_state',
+                 '_zip_code', '_state_fips_code', '_county_fips_code', '_tract',
+                 '_block', '_geographies')
+
+    entity_type = 'address'
+
+    _INSPECT_NAMES = (
+        'address',
+        'latitude',
+        'longitude',
+        'tigerline_id',
+        'tigerline_side',
+        'from_address',
+        'to_address',
+        'street',
+        'pre_type',
+        'pre_direction',
+        'pre_qualifier',
+        'suffix_type',
+        'suffix_direction',
+        'suffix_qualifier',
+        'city',
+        'state',
+        'zip_code'
+    )
+    _INSPECT_CENSUS_NAMES = (
+        'matchedAddress',
+        'coordinates.y',
+        'coordinates.x',
+        'tigerLine.tigerLineId',
+        'tigerLine.side',
+        'addressComponents.fromAddress',
+        'addressComponents.toAddress',
+        'addressComponents.streetName',
+        'addressComponents.preType',
+        'addressComponents.preDirection',
+        'addressComponents.preQualifier',
+        'addressComponents.suffixType',
+        'addressComponents.suffixDirection',
+        'addressComponents.suffixQualifier',
+        'addressComponents.city',
+        'addressComponents.state',
+        'addressComponents.zip'
+    )
+    _INSPECT_GETTER = attrgetter(*(f'_{name}' for name in _INSPECT_NAMES))
+
     def __init__(self, **kwargs):
         self._tigerline_side = None
         self._tigerline_id = None
@@ -43,9 +95,10 @@ class MatchedAddress(metaclasses.BaseEntity):
 
         self._geographies = None
 
-        for key in kwargs:
-            if hasattr(self, key):
-                setattr(self, key, kwargs.get(key, None))
+        known_fields = self._KNOWN_FIELDS
+        for key, value in kwargs.items():
+            if key in known_fields:
+                setattr(self, key, value)
 
     def inspect(self, as_census_fields = False):
         """Produce a list of the matched address properties that have values.
@@ -58,95 +111,20 @@ class MatchedAddress(metaclasses.BaseEntity):
 
         :rtype: :class:`list <python:list>` of :class:`str <python:str>`
         """
-        result = []
-        if self.address and as_census_fields:
-            result.append('matchedAddress')
-        elif self.address:
-            result.append('address')
-
-        if self.latitude and as_census_fields:
-            result.append('coordinates.y')
-        elif self.latitude:
-            result.append('latitude')
-        if self.longitude and as_census_fields:
-            result.append('coordinates.x')
-        elif self.longitude:
-            result.append('longitude')
-
-        if self.tigerline_id and as_census_fields:
-            result.append('tigerLine.tigerLineId')
-        elif self.tigerline_id:
-                result.append('tigerline_id')
-        if self.tigerline_side and as_census_fields:
-            result.append('tigerLine.side')
-        elif self.tigerline_side:
-            result.append('tigerline_side')
-
-        if self.from_address and as_census_fields:
-            result.append('addressComponents.fromAddress')
-        elif self.from_address:
-            result.append('from_address')
-        if self.to_address and as_census_fields:
-            result.append('addressComponents.toAddress')
-        elif self.to_address:
-            result.append('to_address')
-        if self.street and as_census_fields:
-            result.append('addressComponents.streetName')
-        elif self.street:
-            result.append('street')
-        if self.pre_type and as_census_fields:
-            result.append('addressComponents.preType')
-        elif self.pre_type:
-            result.append('pre_type')
-        if self.pre_direction and as_census_fields:
-            result.append('addressComponents.preDirection')
-        elif self.pre_direction:
-            result.append('pre_direction')
-        if self.pre_qualifier and as_census_fields:
-            result.append('addressComponents.preQualifier')
-        elif self.pre_qualifier:
-            result.append('pre_qualifier')
-        if self.suffix_type and as_census_fields:
-            result.append('addressComponents.suffixType')
-        elif self.suffix_type:
-            result.append('suffix_type')
-        if self.suffix_direction and as_census_fields:
-            result.append('addressComponents.suffixDirection')
-        elif self.suffix_direction:
-            result.append('suffix_direction')
-        if self.suffix_qualifier and as_census_fields:
-            result.append('addressComponents.suffixQualifier')
-        elif self.suffix_qualifier:
-            result.append('suffix_qualifier')
-        if self.city and as_census_fields:
-            result.append('addressComponents.city')
-        elif self.city:
-            result.append('city')
-        if self.state and as_census_fields:
-            result.append('addressComponents.state')
-        elif self.state:
-            result.append('state')
-        if self.zip_code and as_census_fields:
-            result.append('addressComponents.zip')
-        elif self.zip_code:
-            result.append('zip_code')
+        names = self._INSPECT_CENSUS_NAMES if as_census_fields else self._INSPECT_NAMES
+        result = list(compress(names, self._INSPECT_GETTER(self)))
 
         if self.geographies:
             result.append('geographies')
 
         return result
 
-    @property
-    def tigerline_id(self):
-        """The TigerLine ID for the matched address.
+    tigerline_id = metaclasses.StringField(
+        doc = """The TigerLine ID for the matched address.
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._tigerline_id
-
-    @tigerline_id.setter
-    def tigerline_id(self, value):
-        self._tigerline_id = validators.string(value, allow_empty = True)
+    )
 
     @property
     def tigerline_side(self):
@@ -192,163 +170,98 @@ class MatchedAddress(metaclasses.BaseEntity):
     def latitude(self, value):
         self._latitude = validators.decimal(value, allow_empty = True)
 
-    @property
-    def address(self):
-        """The canonical address that was matched for the :class:`Location`.
+    address = metaclasses.StringField(
+        doc = """The canonical address that was matched for the :class:`Location`.
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._address
+    )
 
-    @address.setter
-    def address(self, value):
-        self._address = validators.string(value, allow_empty = True)
-
-    @property
-    def pre_type(self):
-        """The canonical pre-type that was matched for the :class:`Location`.
+    pre_type = metaclasses.StringField(
+        doc = """The canonical pre-type that was matched for the :class:`Location`.
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._pre_type
+    )
 
-    @pre_type.setter
-    def pre_type(self, value):
-        self._pre_type = validators.string(value, allow_empty = True)
-
-    @property
-    def suffix_type(self):
-        """The canonical suffix-type that was matched for the :class:`Location`.
+    suffix_type = metaclasses.StringField(
+        doc = """The canonical suffix-type that was matched for the :class:`Location`.
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._suffix_type
+    )
 
-    @suffix_type.setter
-    def suffix_type(self, value):
-        self._suffix_type = validators.string(value, allow_empty = True)
+    pre_qualifier = metaclasses.StringField(
+        doc = """The canonical pre-qualifier that was matched for the :class:`Location`.
 
-    @property
-    def pre_qualifier(self):
-        """The canonical pre-qualifier that was matched for the :class:`Location`.
-
-        :rqualifier: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._pre_qualifier
+    )
 
-    @pre_qualifier.setter
-    def pre_qualifier(self, value):
-        self._pre_qualifier = validators.string(value, allow_empty = True)
+    suffix_qualifier = metaclasses.StringField(
+        doc = """The canonical suffix-qualifier that was matched for the :class:`Location`.
 
-    @property
-    def suffix_qualifier(self):
-        """The canonical suffix-qualifier that was matched for the :class:`Location`.
-
-        :rqualifier: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._suffix_qualifier
+    )
 
-    @suffix_qualifier.setter
-    def suffix_qualifier(self, value):
-        self._suffix_qualifier = validators.string(value, allow_empty = True)
+    pre_direction = metaclasses.StringField(
+        doc = """The canonical pre-direction that was matched for the :class:`Location`.
 
-    @property
-    def pre_direction(self):
-        """The canonical pre-direction that was matched for the :class:`Location`.
-
-        :rdirection: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._pre_direction
+    )
 
-    @pre_direction.setter
-    def pre_direction(self, value):
-        self._pre_direction = validators.string(value, allow_empty = True)
-
-    @property
-    def suffix_direction(self):
-        """The canonical suffix-direction that was matched for the :class:`Location`.
+    suffix_direction = metaclasses.StringField(
+        doc = """The canonical suffix-direction that was matched for the :class:`Location`.
 
-        :rdirection: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._suffix_direction
-
-    @suffix_direction.setter
-    def suffix_direction(self, value):
-        self._suffix_direction = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def from_address(self):
-        """The canonical lower-bound street number that was matched for the
+    from_address = metaclasses.StringField(
+        doc = """The canonical lower-bound street number that was matched for the
         :class:`Location`.
 
-        :rdirection: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._from_address
-
-    @from_address.setter
-    def from_address(self, value):
-        self._from_address = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def to_address(self):
-        """The canonical upper-bound street number that was matched for the
+    to_address = metaclasses.StringField(
+        doc = """The canonical upper-bound street number that was matched for the
         :class:`Location`.
 
-        :rdirection: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._to_address
-
-    @to_address.setter
-    def to_address(self, value):
-        self._to_address = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def street(self):
-        """The canonical street name that was matched for the :class:`Location`.
+    street = metaclasses.StringField(
+        doc = """The canonical street name that was matched for the :class:`Location`.
 
-        :rdirection: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._street
+    )
 
-    @street.setter
-    def street(self, value):
-        self._street = validators.string(value, allow_empty = True)
+    city = metaclasses.StringField(
+        doc = """The canonical city name that was matched for the :class:`Location`.
 
-    @property
-    def city(self):
-        """The canonical city name that was matched for the :class:`Location`.
-
-        :rdirection: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._city
+    )
 
-    @city.setter
-    def city(self, value):
-        self._city = validators.string(value, allow_empty = True)
+    state = metaclasses.InternedField(
+        doc = """The canonical state that was matched for the :class:`Location`.
 
-    @property
-    def state(self):
-        """The canonical state that was matched for the :class:`Location`.
-
-        :rdirection: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._state
+    )
 
-    @state.setter
-    def state(self, value):
-        self._state = validators.string(value, allow_empty = True)
+    zip_code = metaclasses.StringField(
+        doc = """The canonical zip code that was matched for the :class:`Location`.
 
-    @property
-    def zip_code(self):
-        """The canonical zip code that was matched for the :class:`Location`.
-
-        :rdirection: :class:`str <python:str>` / :obj:`None <python:None>`
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._zip_code
-
-    @zip_code.setter
-    def zip_code(self, value):
-        self._zip_code = validators.string(value, allow_empty = True)
+    )
 
     @property
     def geographies(self):
@@ -365,7 +278,6 @@ class MatchedAddress(metaclasses.BaseEntity):
     @geographies.setter
     def geographies(self, value):
         if value and not isinstance(value, geographies.GeographyCollection):
-            value = validators.dict(value, allow_empty = False)
             geos = geographies.GeographyCollection.from_dict(value)
         elif value:
             geos = value
@@ -374,57 +286,33 @@ class MatchedAddress(metaclasses.BaseEntity):
 
         self._geographies = geos
 
-    @property
-    def state_fips_code(self):
-        """State FIPS Code
+    state_fips_code = metaclasses.InternedField(
+        doc = """State FIPS Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._state_fips_code
+    )
 
-    @state_fips_code.setter
-    def state_fips_code(self, value):
-        self._state_fips_code = validators.string(value, allow_empty = True)
-
-    @property
-    def tract(self):
-        """Census Tract Code
+    tract = metaclasses.StringField(
+        doc = """Census Tract Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._tract
-
-    @tract.setter
-    def tract(self, value):
-        self._tract = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def block(self):
-        """Census Block Code
+    block = metaclasses.StringField(
+        doc = """Census Block Code
 
         :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
         """
-        return self._block
-
-    @block.setter
-    def block(self, value):
-        self._block = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def county_fips_code(self):
-        """County FIPS Code
+    county_fips_code = metaclasses.InternedField(
+        doc = """County FIPS Code
 
         :rtype: :class:`str <python:str>`
         """
-        return self._county_fips_code
-
-    @county_fips_code.setter
-    def county_fips_code(self, value):
-        self._county_fips_code = validators.string(value, allow_empty = True)
-
-    @property
-    def entity_type(self):
-        return 'address'
+    )
 
     @classmethod
     def from_csv_record(cls, csv_record):
@@ -437,14 +325,13 @@ class MatchedAddress(metaclasses.BaseEntity):
         :rtype: :class:`GeographicEntity`
 
         """
-        csv_record = validators.iterable(csv_record, allow_empty = False)
+        if not csv_record or not isinstance(csv_record, (list, tuple)):
+            csv_record = validators.iterable(csv_record, allow_empty = False)
 
         one_line_address = csv_record[1]
         matched_address = csv_record[4]
 
-        coordinates = csv_record[5].split(',')
-        longitude = coordinates[0]
-        latitude = coordinates[1]
+        longitude, latitude = csv_record[5].split(',', 1)
 
         tigerline_id = csv_record[6]
         tigerline_side = csv_record[7]
@@ -478,7 +365,8 @@ class MatchedAddress(metaclasses.BaseEntity):
         :rtype: :class:`GeographicEntity`
 
         """
-        as_dict = validators.dict(as_dict, allow_empty = False)
+        if as_dict.__class__ is not dict or not as_dict:
+            as_dict = validators.dict(as_dict, allow_empty = False)
 
         address = as_dict.get('result', {})\
                                  .get('addressMatches', {})\
@@ -555,7 +443,7 @@ class MatchedAddress(metaclasses.BaseEntity):
             'tigerline_id': tigerline_id,
             'tigerline_side': tigerline_side,
             'longitude': longitude,
-            'latitute': latitude,
+            'latitude': latitude,
             'pre_type': pre_type,
             'suffix_type': suffix_type,
             'pre_qualifier': pre_qualifier,
@@ -614,9 +502,25 @@ class MatchedAddress(metaclasses.BaseEntity):
         return result
 
 
+MatchedAddress._KNOWN_FIELDS = frozenset(
+    name for name, member in vars(MatchedAddress).items()
+    if isinstance(member, metaclasses.StringField) or \
+       (isinstance(member, property) and member.fset is not None)
+)
+
+
+
 class Location(metaclasses.GeographicEntity):
     """Represents a specific location returned by the US Census Geocoder API."""
 
+    __slots__ = ('_input_one_line', '_input_street', '_input_city', '_input_state',
+                 '_input_zip_code', '_benchmark_name', '_benchmark_description',
+                 '_benchmark_id', '_benchmark_is_default', '_vintage_name',
+                 '_vintage_description', '_vintage_id', '_vintage_is_default',
+                 '_matched_addresses')
+
+    entity_type = 'locations'
+
     def __init__(self, **kwargs):
         self._input_one_line = None
         self._input_street = None
@@ -636,9 +540,10 @@ class Location(metaclasses.GeographicEntity):
 
         self._matched_addresses = None
 
-        for key in kwargs:
-            if hasattr(self, key):
-                setattr(self, key, kwargs.get(key, None))
+        known_fields = self._KNOWN_FIELDS
+        for key, value in kwargs.items():
+            if key in known_fields:
+                setattr(self, key, value)
 
     def inspect(self, as_census_fields = False):
         """Produce a list of the location's properties that have values.
@@ -722,65 +627,40 @@ class Location(metaclasses.GeographicEntity):
 
         return result
 
-    @property
-    def input_one_line(self):
-        """The one-line address that was provided as input to get this :class:`Location`.
+    input_one_line = metaclasses.StringField(
+        doc = """The one-line address that was provided as input to get this :class:`Location`.
 
         :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
         """
-        return self._input_one_line
+    )
 
-    @input_one_line.setter
-    def input_one_line(self, value):
-        self._input_one_line = validators.string(value, allow_empty = True)
-
-    @property
-    def input_street(self):
-        """The street address that was provided as input to get this :class:`Location`.
+    input_street = metaclasses.StringField(
+        doc = """The street address that was provided as input to get this :class:`Location`.
 
         :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
         """
-        return self._input_street
+    )
 
-    @input_street.setter
-    def input_street(self, value):
-        self._input_street = validators.string(value, allow_empty = True)
-
-    @property
-    def input_city(self):
-        """The city that was provided as input to get this :class:`Location`.
+    input_city = metaclasses.StringField(
+        doc = """The city that was provided as input to get this :class:`Location`.
 
         :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
         """
-        return self._input_city
+    )
 
-    @input_city.setter
-    def input_city(self, value):
-        self._input_city = validators.string(value, allow_empty = True)
-
-    @property
-    def input_state(self):
-        """The state that was provided as input to get this :class:`Location`.
+    input_state = metaclasses.StringField(
+        doc = """The state that was provided as input to get this :class:`Location`.
 
         :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
         """
-        return self._input_state
-
-    @input_state.setter
-    def input_state(self, value):
-        self._input_state = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def input_zip_code(self):
-        """The zip code that was provided as input to get this :class:`Location`.
+    input_zip_code = metaclasses.StringField(
+        doc = """The zip code that was provided as input to get this :class:`Location`.
 
         :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
         """
-        return self._input_zip_code
-
-    @input_zip_code.setter
-    def input_zip_code(self, value):
-        self._input_zip_code = validators.string(value, allow_empty = True)
+    )
 
     @property
     def input_address(self):
@@ -806,41 +686,26 @@ class Location(metaclasses.GeographicEntity):
 
         return result
 
-    @property
-    def benchmark_name(self):
-        """The name of the :term:`benchmark` for which this data was returned.
+    benchmark_name = metaclasses.StringField(
+        doc = """The name of the :term:`benchmark` for which this data was returned.
 
         :rtype: :class:`str <python:str>`
         """
-        return self._benchmark_name
+    )
 
-    @benchmark_name.setter
-    def benchmark_name(self, value):
-        self._benchmark_name = validators.string(value, allow_empty = True)
-
-    @property
-    def benchmark_description(self):
-        """The description of the :term:`benchmark` for which this data was returned.
+    benchmark_description = metaclasses.StringField(
+        doc = """The description of the :term:`benchmark` for which this data was returned.
 
         :rtype: :class:`str <python:str>`
         """
-        return self._benchmark_description
+    )
 
-    @benchmark_description.setter
-    def benchmark_description(self, value):
-        self._benchmark_description = validators.string(value, allow_empty = True)
-
-    @property
-    def benchmark_id(self):
-        """The name of the :term:`benchmark` for which this data was returned.
+    benchmark_id = metaclasses.StringField(
+        doc = """The name of the :term:`benchmark` for which this data was returned.
 
         :rtype: :class:`str <python:str>`
         """
-        return self._benchmark_id
-
-    @benchmark_id.setter
-    def benchmark_id(self, value):
-        self._benchmark_id = validators.string(value, allow_empty = True)
+    )
 
     @property
     def benchmark_is_default(self):
@@ -867,41 +732,26 @@ class Location(metaclasses.GeographicEntity):
 
         return None
 
-    @property
-    def vintage_name(self):
-        """The name of the :term:`vintage` for which this data was returned.
+    vintage_name = metaclasses.StringField(
+        doc = """The name of the :term:`vintage` for which this data was returned.
 
         :rtype: :class:`str <python:str>`
         """
-        return self._vintage_name
-
-    @vintage_name.setter
-    def vintage_name(self, value):
-        self._vintage_name = validators.string(value, allow_empty = True)
+    )
 
-    @property
-    def vintage_description(self):
-        """The description of the :term:`vintage` for which this data was returned.
+    vintage_description = metaclasses.StringField(
+        doc = """The description of the :term:`vintage` for which this data was returned.
 
         :rtype: :class:`str <python:str>`
         """
-        return self._vintage_description
+    )
 
-    @vintage_description.setter
-    def vintage_description(self, value):
-        self._vintage_description = validators.string(value, allow_empty = True)
-
-    @property
-    def vintage_id(self):
-        """The name of the :term:`vintage` for which this data was returned.
+    vintage_id = metaclasses.StringField(
+        doc = """The name of the :term:`vintage` for which this data was returned.
 
         :rtype: :class:`str <python:str>`
         """
-        return self._vintage_id
-
-    @vintage_id.setter
-    def vintage_id(self, value):
-        self._vintage_id = validators.string(value, allow_empty = True)
+    )
 
     @property
     def vintage_is_default(self):
@@ -951,10 +801,6 @@ class Location(metaclasses.GeographicEntity):
 
         self._matched_addresses = [x for x in value]
 
-    @property
-    def entity_type(self):
-        return 'locations'
-
     @classmethod
     def from_csv_record(cls, csv_record):
         """Create an instance of the geographic entity from its CSV record.
@@ -966,14 +812,13 @@ class Location(metaclasses.GeographicEntity):
         :rtype: :class:`GeographicEntity`
 
         """
-        csv_record = validators.iterable(csv_record, allow_empty = False)
+        if not csv_record or not isinstance(csv_record, (list, tuple)):
+            csv_record = validators.iterable(csv_record, allow_empty = False)
 
         one_line_address = csv_record[1]
         matched_address = csv_record[4]
 
-        coordinates = csv_record[5].split(',')
-        longitude = coordinates[0]
-        latitude = coordinates[1]
+        longitude, latitude = csv_record[5].split(',', 1)
 
         tigerline_id = csv_record[6]
         tigerline_side = csv_record[7]
@@ -1010,7 +855,8 @@ class Location(metaclasses.GeographicEntity):
         :rtype: :class:`GeographicEntity`
 
         """
-        as_dict = validators.dict(as_dict, allow_empty = False)
+        if as_dict.__class__ is not dict or not as_dict:
+            as_dict = validators.dict(as_dict, allow_empty = False)
 
         input_one_line = as_dict.get('result', {})\
                                 .get('input', {})\
@@ -1139,3 +985,10 @@ class Location(metaclasses.GeographicEntity):
             result['input']['address']['state'] = self.input_state
         if self.input_zip_code:
             result['input']['address']['zip'] = self.input_zip_code
+
+
+Location._KNOWN_FIELDS = frozenset(
+    name for name, member in vars(Location).items()
+    if isinstance(member, metaclasses.StringField) or \
+       (isinstance(member, property) and member.fset is not None)
+)
@@ -7,20 +7,216 @@ Defines the metaclasses that are used throughout the library.
 
 """
 import os
+import sys
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 import csv
+import hashlib
+import io
+from itertools import islice
 import json
+import threading
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 from validator_collection import validators
 from backoff_utils import backoff
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 from census_geocoder import errors
 from census_geocoder.constants import CENSUS_API_URL, BENCHMARKS, VINTAGES, LAYERS
 
 DEFAULT_BENCHMARK = os.environ.get('CENSUS_GEOCODER_BENCHMARK', 'CURRENT')
 DEFAULT_VINTAGE = os.environ.get('CENSUS_GEOCODER_VINTAGE', 'CURRENT')
 DEFAULT_LAYERS = os.environ.get('CENSUS_GEOCODER_LAYERS', 'all')
+BATCH_COLUMNS = 12
+CACHE_SIZE = int(os.environ.get('CENSUS_GEOCODER_CACHE_SIZE', 10000))
+FLOAT_COORDINATES = os.environ.get('CENSUS_GEOCODER_FLOAT_COORDINATES',
+                                   'false').lower() in ('1', 'true', 'yes')
+
+_RESPONSE_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_DISK_CACHE = None
+
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections = 16,
+                                      pool_maxsize = 32))
+
+ENDPOINT_URLS = {
+    (entity_type, endpoint): f'{CENSUS_API_URL}/geocoder/{entity_type}/{endpoint}'
+    for entity_type in ('locations', 'geographies')
+    for endpoint in ('onelineaddress', 'address', 'addressbatch', 'coordinates')
+}
+
+
+@lru_cache(maxsize = 64)
+def _query_prefix(benchmark, vintage, layers):
+    """Return the URL-encoded query string shared by every request for a given
+    ``benchmark``, ``vintage``, and ``layers``.
+
+    :rtype: :class:`str <python:str>`
+    """
+    parameters = {
+        'benchmark': benchmark,
+        'vintage': vintage,
+        'format': 'json'
+    }
+    if layers:
+        parameters['layers'] = layers
+
+    return urlencode(parameters)
+
+
+def _request_url(entity_type, endpoint, benchmark, vintage, layers, **parameters):
+    """Assemble the full request URL for an API call, encoding only the
+    request-specific ``parameters``.
+
+    :rtype: :class:`str <python:str>`
+    """
+    prefix = _query_prefix(benchmark, vintage, layers)
+    url = f'{ENDPOINT_URLS[(entity_type, endpoint)]}?{prefix}'
+    if parameters:
+        url = f'{url}&{urlencode(parameters)}'
+
+    return url
+
+
+def _cache_key(request_url):
+    """Return the key under which the response to a request should be cached.
+
+    The request URL is lower-cased so that differently-capitalized spellings of the
+    same address share a cache entry. The key is a 64-bit integer digest (computed
+    using ``xxhash`` when it is installed), which is stable across processes.
+
+    :param request_url: The fully-assembled URL (including query string) that the
+      request is sent to.
+    :type request_url: :class:`str <python:str>`
+
+    :rtype: :class:`int <python:int>`
+    """
+    normalized = request_url.lower().encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(normalized)
+
+    return int.from_bytes(hashlib.blake2b(normalized, digest_size = 8).digest(), 'big')
+
+
+def _get_cached(key):
+    """Return the cached response body for ``key``, or :obj:`None <python:None>`.
+
+    The in-memory cache is checked first, followed by the on-disk cache (if one has
+    been enabled using :func:`enable_disk_cache`).
+    """
+    with _CACHE_LOCK:
+        content = _RESPONSE_CACHE.get(key, None)
+        if content is not None:
+            _RESPONSE_CACHE.move_to_end(key)
+
+    if content is None and _DISK_CACHE is not None:
+        content = _DISK_CACHE.get(key, None)
+        if content is not None:
+            _set_cached(key, content, persist = False)
+
+    return content
+
+
+def _set_cached(key, content, persist = True):
+    """Cache the response body ``content`` under ``key``, evicting the least
+    recently used entry once the cache holds more than ``CACHE_SIZE`` entries. If
+    ``persist`` is ``True`` and an on-disk cache is enabled, the body is written to it
+    as well."""
+    if CACHE_SIZE > 0:
+        with _CACHE_LOCK:
+            _RESPONSE_CACHE[key] = content
+            _RESPONSE_CACHE.move_to_end(key)
+            while len(_RESPONSE_CACHE) > CACHE_SIZE:
+                _RESPONSE_CACHE.popitem(last = False)
+
+    if persist and _DISK_CACHE is not None:
+        _DISK_CACHE.set(key, content)
+
+
+def enable_disk_cache(path = '~/.cache/census_geocoder', size_limit_gb = 1):
+    """Persist `Census Geocoder API`_ responses to disk, so that they survive process
+    restarts.
+
+    .. note::
+
+      Requires `diskcache <http://www.grantjenks.com/docs/diskcache/>`_, which can be
+      installed using ``pip install census-geocoder[diskcache]``.
+
+    :param path: The directory in which to store the cache. Defaults to
+      ``'~/.cache/census_geocoder'``.
+    :type path: :class:`str <python:str>`
+
+    :param size_limit_gb: The maximum size of the on-disk cache, in gigabytes. Defaults
+      to ``1``.
+    :type size_limit_gb: numeric
+
+    :returns: The on-disk cache.
+    :rtype: :class:`diskcache.Cache`
+
+    :raises ImportError: if `diskcache <http://www.grantjenks.com/docs/diskcache/>`_ is
+      not installed
+    """
+    global _DISK_CACHE
+
+    if diskcache is None:
+        raise ImportError('enable_disk_cache() requires diskcache. Please install it '
+                          'using "pip install census-geocoder[diskcache]".')
+
+    size_limit_gb = validators.numeric(size_limit_gb, minimum = 0)
+    path = os.path.expanduser(validators.string(path, allow_empty = False))
+
+    if _DISK_CACHE is not None:
+        _DISK_CACHE.close()
+
+    _DISK_CACHE = diskcache.Cache(path, size_limit = int(size_limit_gb * 1024 ** 3))
+
+    return _DISK_CACHE
+
+
+def disable_disk_cache():
+    """Stop persisting `Census Geocoder API`_ responses to disk. Responses already
+    written to disk are kept."""
+    global _DISK_CACHE
+
+    if _DISK_CACHE is not None:
+        _DISK_CACHE.close()
+
+    _DISK_CACHE = None
+
+
+def clear_cache():
+    """Clear the cache of `Census Geocoder API`_ responses, including the on-disk cache
+    if one has been enabled."""
+    with _CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+    if _DISK_CACHE is not None:
+        _DISK_CACHE.clear()
 
 
 def parse_benchmark_vintage_layers(benchmark = DEFAULT_BENCHMARK,
@@ -110,10 +306,254 @@ def check_length(file_):
     return row_count
 
 
+def _post_batch(url, address_file):
+    """Submit a batch of addresses to the `Census Geocoder API`_ and return the parsed
+    CSV response.
+
+    :param url: The batch endpoint (including query string) to submit the addresses to.
+    :type url: :class:`str <python:str>`
+
+    :param address_file: The ``addressFile`` entry to upload, as accepted by
+      :meth:`requests.Session.post`.
+    :type address_file: :class:`tuple <python:tuple>`
+
+    :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+      :class:`str <python:str>`
+
+    :raises MalformedBatchFileError: if the API rejected the batch as malformed
+    :raises CensusAPIError: if the Census Geocoder API returned an error
+
+    """
+    result = backoff(SESSION.post,
+                     args = [url],
+                     kwargs = {
+                         'files': {'addressFile': address_file}
+                     },
+                     max_tries = 5,
+                     max_delay = 10)
+
+    if result.status_code >= 400 and b'Malformed input' in result.content:
+        raise errors.MalformedBatchFileError('The batch file submitted did not have '
+                                             'the expected/required structure. Please'
+                                             ' check and resubmit.')
+    elif result.status_code >= 400:
+        raise errors.CensusAPIError(
+            f'Census Geocoder API returned status code {result.status_code} with '
+            f'message: "{result.text}".'
+        )
+
+    return _parse_batch_csv(result.content)
+
+
+def _parse_batch_csv(content):
+    """Parse the CSV body returned by the batch endpoint into a list of records.
+
+    Uses the C parser in `pandas <https://pandas.pydata.org/>`_ when it is installed,
+    and falls back to the standard library :mod:`csv <python:csv>` module otherwise,
+    or if a record has more than ``BATCH_COLUMNS`` fields. Records keep their original
+    (ragged) length, since unmatched addresses return fewer columns. Blank lines are
+    skipped.
+
+    .. note::
+
+      pandas cannot distinguish a missing field from an empty one, so the pandas path
+      trims trailing empty fields from each record. Records returned by the Census
+      Geocoder API never end in an empty field.
+
+    :param content: The raw response body.
+    :type content: :class:`bytes <python:bytes>`
+
+    :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+      :class:`str <python:str>`
+
+    """
+    if not content.strip():
+        return []
+
+    if pandas is not None:
+        try:
+            frame = pandas.read_csv(io.BytesIO(content),
+                                    engine = 'c',
+                                    header = None,
+                                    names = range(BATCH_COLUMNS),
+                                    dtype = str,
+                                    keep_default_na = False,
+                                    encoding = 'utf-8')
+        except pandas.errors.ParserError:
+            frame = None
+
+        if frame is not None:
+            csv_list = []
+            for row in frame.itertuples(index = False, name = None):
+                row = list(row)
+                while row and not row[-1]:
+                    row.pop()
+                csv_list.append(row)
+
+            return csv_list
+
+    content = content.decode('utf-8')
+
+    csv_reader = csv.reader(content.splitlines(), delimiter = ',')
+    csv_list = [row for row in csv_reader if row]
+
+    return csv_list
+
+
+class StringField(object):
+    """Data descriptor for a string attribute whose value is held in an
+    underscore-prefixed slot of the same name (e.g. ``geoid`` is held in ``_geoid``).
+
+    Empty values are stored as :obj:`None <python:None>`.
+
+    :param doc: The docstring to expose for the attribute.
+    :type doc: :class:`str <python:str>` / :obj:`None <python:None>`
+    """
+
+    def __init__(self, doc = None):
+        self.__doc__ = doc
+        self.name = None
+        self.attribute = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.attribute = f'_{name}'
+
+    def __get__(self, instance, owner = None):
+        if instance is None:
+            return self
+
+        return getattr(instance, self.attribute)
+
+    def __set__(self, instance, value):
+        setattr(instance, self.attribute, self.validate(value))
+
+    def validate(self, value):
+        """Return ``value`` validated and coerced for storage."""
+        if value.__class__ is str:
+            return value or None
+
+        return validators.string(value, allow_empty = True)
+
+
+class NumericField(StringField):
+    """Data descriptor for a numeric attribute. See :class:`StringField`."""
+
+    def validate(self, value):
+        if value.__class__ is int or value.__class__ is float:
+            return value
+
+        return validators.numeric(value, allow_empty = True)
+
+
+class IntegerField(StringField):
+    """Data descriptor for an integer attribute. See :class:`StringField`.
+
+    :param doc: The docstring to expose for the attribute.
+    :type doc: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :param minimum: The minimum value allowed. Defaults to
+      :obj:`None <python:None>` (no minimum).
+    :type minimum: :class:`int <python:int>` / :obj:`None <python:None>`
+    """
+
+    def __init__(self, doc = None, minimum = None):
+        super().__init__(doc = doc)
+        self.minimum = minimum
+
+    def validate(self, value):
+        if value.__class__ is int and (self.minimum is None or value >= self.minimum):
+            return value
+
+        return validators.integer(value, allow_empty = True, minimum = self.minimum)
+
+
+class CoordinateField(StringField):
+    """Data descriptor for a latitude or longitude attribute, which the
+    `Census Geocoder API`_ returns as a zero-padded, explicitly-signed string (e.g.
+    ``'+038.8293079'``). Stored as a :class:`Decimal <python:decimal.Decimal>`, or as a
+    :class:`float <python:float>` if the owning instance's ``float_coordinates``
+    attribute is ``True``. See :class:`StringField`."""
+
+    def __set__(self, instance, value):
+        setattr(instance,
+                self.attribute,
+                self.validate(value,
+                              as_float = getattr(instance, 'float_coordinates', False)))
+
+    def validate(self, value, as_float = False):
+        value = super().validate(value)
+        if not value:
+            return None
+
+        value = value.lstrip('+0') or '0'
+        if as_float:
+            try:
+                return float(value)
+            except ValueError:
+                return validators.float(value, allow_empty = True)
+
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            return validators.decimal(value, allow_empty = True)
+
+
+class InternedField(StringField):
+    """Data descriptor for a string attribute drawn from a small, fixed set of codes
+    (e.g. state FIPS codes). Values are interned with :func:`sys.intern
+    <python:sys.intern>` so that every instance holding the same code shares a single
+    string object. See :class:`StringField`."""
+
+    def validate(self, value):
+        value = super().validate(value)
+        if value:
+            value = sys.intern(value)
+
+        return value
+
+
+class CodedField(InternedField):
+    """Data descriptor for a string attribute holding a code from a lookup ``table``.
+    Recognized codes are stored upper-cased and interned. See :class:`InternedField`.
+
+    :param table: The lookup table of recognized codes.
+    :type table: :class:`dict <python:dict>`
+
+    :param doc: The docstring to expose for the attribute.
+    :type doc: :class:`str <python:str>` / :obj:`None <python:None>`
+    """
+
+    def __init__(self, table, doc = None):
+        super().__init__(doc = doc)
+        self.table = table
+
+    def validate(self, value):
+        value = StringField.validate(self, value)
+        if not value:
+            return value
+
+        code = value.upper()
+        return sys.intern(code if code in self.table else value)
+
+
+class LayerField(StringField):
+    """Data descriptor for a :class:`GeographyCollection
+    <census_geocoder.geographies.GeographyCollection>` layer, whose list of geographic
+    areas is held in an underscore-prefixed slot of the same name. Assigned values are
+    validated by the owner's ``_set_hidden_property()`` method. See
+    :class:`StringField`."""
+
+    def __set__(self, instance, value):
+        instance._set_hidden_property(value, self.name)
+
+
 class BaseEntity(ABC):
     """Abstract base clase for geographic entities that may or may not be supported by the
     API."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def entity_type(self):
@@ -170,6 +610,20 @@ class BaseEntity(ABC):
         """
         raise NotImplementedError()
 
+    @classmethod
+    def from_csv_records(cls, csv_records):
+        """Create instances of the geographic entity from many CSV records.
+
+        :param csv_records: The CSV records, each a list of columns.
+        :type csv_records: iterable of :class:`list <python:list>` of
+          :class:`str <python:str>`
+
+        :returns: Instances of the geographic entity, one per record.
+        :rtype: :class:`list <python:list>` of :class:`GeographicEntity`
+
+        """
+        return [cls.from_csv_record(x) for x in csv_records]
+
     @abstractmethod
     def to_dict(self):
         """Returns a :class:`dict <python:dict>` representation of the geographic entity.
@@ -205,6 +659,8 @@ class GeographicEntity(BaseEntity):
     """Abstract base class for geographic entities that *are* supported by the API.
     """
 
+    __slots__ = ()
+
     @classmethod
     def _get_one_line(cls,
                       one_line,
@@ -278,26 +734,26 @@ class GeographicEntity(BaseEntity):
                                                                     vintage,
                                                                     layers)
 
-        parameters = {
-            'address': one_line,
-            'benchmark': benchmark,
-            'vintage': vintage,
-            'format': 'json'
-        }
-        if layers:
-            parameters['layers'] = layers
-
         instance = cls()
 
-        url = f'{CENSUS_API_URL}/geocoder/{instance.entity_type}/onelineaddress'
+        url = _request_url(instance.entity_type,
+                           'onelineaddress',
+                           benchmark,
+                           vintage,
+                           layers,
+                           address = one_line.strip())
+
+        cache_key = _cache_key(url)
+        cached = _get_cached(cache_key)
+        if cached is not None:
+            return json_loads(cached)
 
-        result = backoff(requests.get,
+        result = backoff(SESSION.get,
                          args = [url],
-                         kwargs = {'params': parameters},
                          max_tries = 5,
                          max_delay = 10)
 
-        if 'Specify street' in result.text:
+        if b'Specify street' in result.content:
             raise errors.ConfigurationError(f'Did not provide a properly parametrized '
                                             'address.')
         elif errors.EntityNotFoundError.evaluate(result,
@@ -311,7 +767,9 @@ class GeographicEntity(BaseEntity):
                 f'message: "{result.text}".'
             )
 
-        return result.json()
+        _set_cached(cache_key, result.content)
+
+        return json_loads(result.content)
 
     @classmethod
     def _get_address(cls,
@@ -415,13 +873,7 @@ class GeographicEntity(BaseEntity):
                                                                     vintage,
                                                                     layers)
 
-        parameters = {
-            'benchmark': benchmark,
-            'vintage': vintage,
-            'format': 'json'
-        }
-        if layers:
-            parameters['layers'] = layers
+        parameters = {}
 
         is_valid = False
         if street_1:
@@ -442,15 +894,24 @@ class GeographicEntity(BaseEntity):
 
         instance = cls()
 
-        url = f'{CENSUS_API_URL}/geocoder/{instance.entity_type}/address'
+        url = _request_url(instance.entity_type,
+                           'address',
+                           benchmark,
+                           vintage,
+                           layers,
+                           **parameters)
+
+        cache_key = _cache_key(url)
+        cached = _get_cached(cache_key)
+        if cached is not None:
+            return json_loads(cached)
 
-        result = backoff(requests.get,
+        result = backoff(SESSION.get,
                          args = [url],
-                         kwargs = {'params': parameters},
                          max_tries = 5,
                          max_delay = 10)
 
-        if 'Specify street' in result.text:
+        if b'Specify street' in result.content:
             raise errors.ConfigurationError(f'Did not provide a properly parametrized '
                                             f'address.')
         elif errors.EntityNotFoundError.evaluate(result,
@@ -464,7 +925,9 @@ class GeographicEntity(BaseEntity):
                 f'message: "{result.text}".'
             )
 
-        return result.json()
+        _set_cached(cache_key, result.content)
+
+        return json_loads(result.content)
 
     @classmethod
     def _get_batch_addresses(cls,
@@ -533,46 +996,93 @@ class GeographicEntity(BaseEntity):
             raise errors.BatchSizeTooLargeError(f'Batch Too Large. Max of 10,000 entries '
                                                 f'supported. File contains {file_length}')
 
-        parameters = {
-            'benchmark': benchmark,
-            'vintage': vintage,
-            'format': 'json'
-        }
-        if layers:
-            parameters['layers'] = layers
-
         instance = cls()
 
-        url = f'{CENSUS_API_URL}/geocoder/{instance.entity_type}/addressbatch'
+        url = _request_url(instance.entity_type,
+                           'addressbatch',
+                           benchmark,
+                           vintage,
+                           layers)
 
         with open(file_, 'rb') as file_object:
-            files = {
-                'addressFile': (file_, file_object)
-            }
-
-            result = backoff(requests.post,
-                             args = [url],
-                             kwargs = {
-                                 'files': files,
-                                 'params': parameters
-                             },
-                             max_tries = 5,
-                             max_delay = 10)
-
-        if result.status_code >= 400 and 'Malformed input' in result.text:
-            raise errors.MalformedBatchFileError('The batch file submitted did not have '
-                                                 'the expected/required structure. Please'
-                                                 ' check and resubmit.')
-        elif result.status_code >= 400:
-            raise errors.CensusAPIError(
-                f'Census Geocoder API returned status code {result.status_code} with '
-                f'message: "{result.text}".'
-            )
+            return _post_batch(url, (file_, file_object))
+
+    @classmethod
+    def _get_batch_records(cls,
+                           records,
+                           benchmark = DEFAULT_BENCHMARK,
+                           vintage = DEFAULT_VINTAGE,
+                           layers = DEFAULT_LAYERS,
+                           chunk_size = 1000):
+        """Return data for an in-memory collection of address records, submitted to the
+        batch endpoint in chunks of ``chunk_size`` without writing a temporary file.
+
+        :param records: The address records to geocode. Each record is a sequence of
+          ``(Unique ID, Street Address, City, State, Zip Code)``.
+        :type records: iterable
+
+        :param benchmark: The name of the :term:`benchmark` of data to return.
+        :type benchmark: :class:`str <python:str>`
+
+        :param vintage: The vintage of Census data for which data should be returned.
+        :type vintage: :class:`str <python:str>`
+
+        :param layers: The set of geographic layers to return for the request.
+        :type layers: :class:`str <python:str>`
+
+        :param chunk_size: The number of records to submit per request. Defaults to
+          ``1000``, and may not exceed ``10000``.
+        :type chunk_size: :class:`int <python:int>`
+
+        :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+          :class:`str <python:str>`
 
-        content = result.content.decode('utf-8')
+        :raises BatchSizeTooLargeError: if ``chunk_size`` exceeds 10,000
+        :raises MalformedBatchFileError: if a record is a string rather than a sequence
+          of fields
+        :raises CensusAPIError: if the Census Geocoder API returned an error
+        :raises UnrecognizedBenchmarkError: if the ``benchmark`` supplied is not
+          recognized
+        :raises UnrecognizedVintageError: if the ``vintage`` supplied is not recognized
+
+        """
+        benchmark, vintage, layers = parse_benchmark_vintage_layers(benchmark,
+                                                                    vintage,
+                                                                    layers)
+
+        chunk_size = validators.integer(chunk_size, minimum = 1)
+        if chunk_size > 10000:
+            raise errors.BatchSizeTooLargeError(f'Batch Too Large. Max of 10,000 entries '
+                                                f'supported. Chunk size is {chunk_size}')
 
-        csv_reader = csv.reader(content.splitlines(), delimiter = ',')
-        csv_list = list(csv_reader)
+        instance = cls()
+
+        url = _request_url(instance.entity_type,
+                           'addressbatch',
+                           benchmark,
+                           vintage,
+                           layers)
+
+        records = iter(records)
+        csv_list = []
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+
+            buffer = io.StringIO()
+            csv_writer = csv.writer(buffer)
+            for record in chunk:
+                # A bare string would otherwise be written one character per column.
+                if isinstance(record, (str, bytes)):
+                    raise errors.MalformedBatchFileError(
+                        f'Batch records must be sequences of (Unique ID, Street Address, '
+                        f'City, State, Zip Code). Received: {record!r}'
+                    )
+                csv_writer.writerow(record)
+
+            csv_list.extend(_post_batch(url,
+                                        ('batch.csv', buffer.getvalue(), 'text/csv')))
 
         return csv_list
 
@@ -632,23 +1142,23 @@ class GeographicEntity(BaseEntity):
                                                                     vintage,
                                                                     layers)
 
-        parameters = {
-            'x': '{0:.6f}'.format(longitude),
-            'y': '{0:.6f}'.format(latitude),
-            'benchmark': benchmark,
-            'vintage': vintage,
-            'format': 'json'
-        }
-        if layers:
-            parameters['layers'] = layers
-
         instance = cls()
 
-        url = f'{CENSUS_API_URL}/geocoder/geographies/coordinates'
+        url = _request_url('geographies',
+                           'coordinates',
+                           benchmark,
+                           vintage,
+                           layers,
+                           x = '{0:.6f}'.format(longitude),
+                           y = '{0:.6f}'.format(latitude))
 
-        result = backoff(requests.get,
+        cache_key = _cache_key(url)
+        cached = _get_cached(cache_key)
+        if cached is not None:
+            return json_loads(cached)
+
+        result = backoff(SESSION.get,
                          args = [url],
-                         kwargs = {'params': parameters},
                          max_tries = 5,
                          max_delay = 10)
 
@@ -663,7 +1173,9 @@ class GeographicEntity(BaseEntity):
                 f'message: "{result.text}".'
             )
 
-        return result.json()
+        _set_cached(cache_key, result.content)
+
+        return json_loads(result.content)
 
     @classmethod
     def from_address(cls, *args, **kwargs):
@@ -813,7 +1325,16 @@ class GeographicEntity(BaseEntity):
           * State
           * Zip Code
 
-        :type file_: :class:`str <python:str>`
+          Alternatively, an iterable of address records with the same columns may be
+          supplied, in which case they are submitted from memory in chunks of
+          ``chunk_size`` records. Each record must be a sequence of fields; bare
+          one-line address strings are not supported by the batch endpoint.
+
+        :type file_: :class:`str <python:str>` / iterable
+
+        :param chunk_size: The number of in-memory records to submit per request. Ignored
+          when ``file_`` is a filename. Defaults to ``1000``.
+        :type chunk_size: :class:`int <python:int>`
 
         :param benchmark: The name of the :term:`benchmark` of data to return. The default
           value is determined by the ``CENSUS_GEOCODER_BENCHMARK`` environment variable,
@@ -870,6 +1391,8 @@ class GeographicEntity(BaseEntity):
         :raises NoFileProvidedError: if no ``file_`` is provided
         :raises FileNotFoundError: if ``file_`` does not exist on the filesystem
         :raises BatchSizeTooLargeError: if ``file_`` contains more than 10,000 records
+        :raises MalformedBatchFileError: if an in-memory record is a string rather than
+          a sequence of fields
         :raises EntityNotFoundError: if no geographic entity was found matching the
           address supplied
         :raises UnrecognizedBenchmarkError: if the ``benchmark`` supplied is not
@@ -880,24 +1403,30 @@ class GeographicEntity(BaseEntity):
         if args:
             file_ = args[0]
         else:
-            file_ = kwargs.get('file_', None)
+            file_ = kwargs.get('file_', None) or kwargs.get('addresses', None)
 
         if not file_:
             raise errors.NoFileProvidedError()
 
-        file_ = validators.file_exists(file_, allow_empty = False)
-
         benchmark = kwargs.get('benchmark', DEFAULT_BENCHMARK)
         vintage = kwargs.get('vintage', DEFAULT_VINTAGE)
 
         layers = kwargs.get('layers', DEFAULT_LAYERS)
 
-        result = cls._get_batch_addresses(file_ = file_,
-                                          benchmark = benchmark,
-                                          vintage = vintage,
-                                          layers = layers)
+        if isinstance(file_, (str, bytes, os.PathLike)):
+            file_ = validators.file_exists(file_, allow_empty = False)
+            result = cls._get_batch_addresses(file_ = file_,
+                                              benchmark = benchmark,
+                                              vintage = vintage,
+                                              layers = layers)
+        else:
+            result = cls._get_batch_records(file_,
+                                            benchmark = benchmark,
+                                            vintage = vintage,
+                                            layers = layers,
+                                            chunk_size = kwargs.get('chunk_size', 1000))
 
-        return [cls.from_csv_record(x) for x in result]
+        return cls.from_csv_records(result)
 
     @classmethod
     def from_coordinates(cls,
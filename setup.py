@@ -116,7 +116,6 @@ setup(
         # Specify the Python versions you support here. In particular, ensure
         # that you indicate whether you support Python 2, Python 3 or both.
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8'
     ],
@@ -178,9 +177,13 @@ setup(
                  'sphinx-tabs',
                  'sphinx-panels',
                  'codecov'],
+        'speedups': ['orjson', 'pysimdjson', 'xxhash'],
+        'async': ['httpx[http2]'],
+        'pandas': ['pandas'],
+        'diskcache': ['diskcache'],
     },
 
-    python_requires='>=3.6, <4',
+    python_requires='>=3.7, <4',
 
     # If there are data files included in your packages that need to be
     # installed, specify them here.
@@ -7,6 +7,8 @@ Tests for the :class:`GeographicArea` class.
 
 """
 
+import decimal
+
 import pytest
 from tests.fixtures import input_files, check_input_file
 
@@ -69,6 +71,92 @@ def test_from_dict(as_dict, error):
             result = GeographicArea.from_dict(as_dict)
 
 
+@pytest.mark.parametrize('as_dict, error', [
+    ({}, None),
+    ({
+        "GEOID": "20746",
+        "CENTLAT": "+38.8366493",
+        "AREAWATER": 47839,
+        "BASENAME": "20746",
+        "OID": "221704257714982",
+        "ZCTA5": "20746",
+        "LSADC": "Z5",
+        "FUNCSTAT": "S",
+        "INTPTLAT": "+38.8364025",
+        "NAME": "ZCTA5 20746",
+        "OBJECTID": 1926,
+        "CENTLON": "-076.9193615",
+        "AREALAND": 19595655,
+        "INTPTLON": "-076.9182650",
+        "MTFCC": "G6350",
+        "ZCTA5CC": "B5"
+     }, None),
+    ({
+        "COUSUB": "90524",
+        "GEOID": "2403390524",
+        "CENTLAT": "+38.8406376",
+        "AREAWATER": 64586,
+        "STATE": "24",
+        "BASENAME": "6, Spauldings",
+        "OID": "27690286313747",
+        "LSADC": "28",
+        "FUNCSTAT": "N",
+        "INTPTLAT": "+38.8404712",
+        "NAME": "District 6, Spauldings",
+        "OBJECTID": 3899,
+        "CENTLON": "-076.9085553",
+        "COUSUBCC": "Z1",
+        "AREALAND": 55544427,
+        "INTPTLON": "-076.9057059",
+        "MTFCC": "G4040",
+        "COUSUBNS": "01929662",
+        "COUNTY": "033"
+     }, None),
+
+    ({
+        "GEOID": "00000",
+        "CENTLAT": "+00.0000000",
+        "CENTLON": "000.0000000"
+     }, None),
+])
+def test_to_dict(as_dict, error):
+    if not error:
+        result = GeographicArea.from_dict(as_dict).to_dict()
+        assert isinstance(result, dict) is True
+        for key in as_dict:
+            assert key in result
+
+        round_trip = GeographicArea.from_dict(result)
+        assert round_trip.to_dict() == result
+
+    else:
+        with pytest.raises(error):
+            result = GeographicArea.from_dict(as_dict).to_dict()
+
+
+@pytest.mark.parametrize('as_dict, as_census_fields, expected', [
+    ({}, False, ['lsad_category']),
+    ({}, True, []),
+    ({
+        "GEOID": "2403390524",
+        "PLACE": "90524",
+        "FUNCSTAT": "N",
+        "CENTLAT": "+38.8406376"
+     }, False, ['geoid', 'funcstat', 'functional_status', 'lsad_category', 'place',
+                'latitude']),
+    ({
+        "GEOID": "2403390524",
+        "PLACE": "90524",
+        "FUNCSTAT": "N",
+        "CENTLAT": "+38.8406376"
+     }, True, ['GEOID', 'FUNCSTAT', 'PLACE', 'CENTLAT']),
+])
+def test_inspect(as_dict, as_census_fields, expected):
+    area = GeographicArea.from_dict(as_dict)
+    result = area.inspect(as_census_fields = as_census_fields)
+    assert result == expected
+
+
 @pytest.mark.parametrize('kwargs, error', [
     ({
         'one_line': '4600 Silver Hill Rd, Washington, DC 20223'
@@ -196,3 +284,95 @@ def test_from_batch(input_files, input_value, kwargs, error):
     else:
         with pytest.raises(error):
             result = GeographicArea.from_batch(**kwargs)
+
+
+@pytest.mark.parametrize('float_coordinates, expected_type', [
+    (False, decimal.Decimal),
+    (True, float),
+])
+def test_float_coordinates(float_coordinates, expected_type):
+    original = GeographicArea.float_coordinates
+    GeographicArea.float_coordinates = float_coordinates
+    try:
+        result = GeographicArea.from_dict({
+            "CENTLAT": "+38.8366493",
+            "CENTLON": "-076.9193615"
+        })
+    finally:
+        GeographicArea.float_coordinates = original
+
+    assert isinstance(result.latitude, expected_type) is True
+    assert isinstance(result.longitude, expected_type) is True
+    assert float(result.latitude) == 38.8366493
+    assert float(result.longitude) == -76.9193615
+    assert result.to_dict()['CENTLON'] == '-76.91936150'
+
+
+def test_hash_and_eq():
+    first = GeographicArea.from_dict({"GEOID": "24033", "NAME": "Prince George's"})
+    second = GeographicArea.from_dict({"GEOID": "24033"})
+    other = GeographicArea.from_dict({"GEOID": "24031"})
+    blank = GeographicArea()
+
+    assert first == second
+    assert first != other
+    assert blank == blank
+    assert blank != GeographicArea()
+    assert len({first, second, other, blank}) == 3
+
+
+@pytest.mark.parametrize('csv_records, error', [
+    ([['1', '4600 Silver Hill Rd, Washington, DC, 20233', 'Match', 'Exact',
+       '4600 SILVER HILL RD, WASHINGTON, DC, 20233', '-76.92744,38.845985',
+       '76355984', 'L', '24', '033', '802405', '2004']], None),
+    ([], None),
+    ([[]], ValueError),
+])
+def test_from_csv_records(csv_records, error):
+    if not error:
+        result = GeographicArea.from_csv_records(csv_records)
+        assert len(result) == len(csv_records)
+        for item, record in zip(result, csv_records):
+            assert item.to_dict() == GeographicArea.from_csv_record(record).to_dict()
+            assert item.state_fips_code == record[8]
+            assert item.block == record[11]
+    else:
+        with pytest.raises(error):
+            result = GeographicArea.from_csv_records(csv_records)
+
+
+@pytest.mark.parametrize('value, expected_code, expected_status, error', [
+    ('S', 'S', 'Statistical Entity', None),
+    ('s', 'S', 'Statistical Entity', None),
+    ('', None, None, None),
+    (None, None, None, None),
+    ('not-a-code', None, None, ValueError),
+])
+def test_funcstat(value, expected_code, expected_status, error):
+    area = GeographicArea()
+    if not error:
+        area.funcstat = value
+        assert area.funcstat == expected_code
+        assert area.functional_status == expected_status
+    else:
+        with pytest.raises(error):
+            area.funcstat = value
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    ({'CUSTOM': '1'}, {'CUSTOM': '1'}, None),
+    ('{"CUSTOM": "1"}', {'CUSTOM': '1'}, None),
+    ({}, {}, None),
+    (None, {}, None),
+    ('not-a-dict', None, TypeError),
+])
+def test_extensions(value, expected, error):
+    area = GeographicArea.from_dict({"GEOID": "24033", "EXTRA": "x"})
+    if not error:
+        area.extensions = value
+        assert area.extensions == expected
+        assert area.to_dict().get('CUSTOM', None) == expected.get('CUSTOM', None)
+        assert 'EXTRA' not in area.to_dict()
+    else:
+        with pytest.raises(error):
+            area.extensions = value
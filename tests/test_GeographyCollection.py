@@ -10,7 +10,8 @@ Tests for the :class:`GeographyCollection` class.
 import pytest
 from tests.fixtures import input_files
 
-from census_geocoder.geographies import GeographyCollection
+from census_geocoder.geographies import GeographyCollection, County, State, \
+    MicropolitanNECTA, lookup_geography, validate_layer_values
 from census_geocoder import constants, errors
 
 
@@ -379,3 +380,97 @@ def test_from_dict(as_dict, error):
     else:
         with pytest.raises(error):
             result = GeographyCollection.from_dict(as_dict)
+
+
+@pytest.mark.parametrize('value, property_name, expected_geoids, error', [
+    ([{"GEOID": "24033"}, {"GEOID": "24031"}], 'counties', ['24033', '24031'], None),
+    ([County(geoid = '24033'), {"GEOID": "24031"}], 'counties', ['24033', '24031'],
+     None),
+    ([5], 'counties', None, ValueError),
+    ([{"GEOID": "24033"}], 'not_a_layer', None, errors.CensusGeocoderError),
+])
+def test_validate_layer_values(value, property_name, expected_geoids, error):
+    if not error:
+        result = validate_layer_values(value, property_name)
+        assert [x.geoid for x in result] == expected_geoids
+        for item in result:
+            assert isinstance(item, County) is True
+    else:
+        with pytest.raises(error):
+            result = validate_layer_values(value, property_name)
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('Counties', 'counties'),
+    ('COUNTIES', 'counties'),
+    ('Zip Code Tabulation Areas', 'zcta5'),
+    ('ZIP Code Tabulation Areas', 'zcta5'),
+    ('Not A Layer', None),
+])
+def test_lookup_geography(name, expected):
+    result = lookup_geography(name)
+    if expected is None:
+        assert result is None
+    else:
+        assert result[0] == expected
+
+
+def test_from_dict_populates_layers():
+    result = GeographyCollection.from_dict({
+        'Counties': [{"GEOID": "24033", "NAME": "Prince George's County"}],
+        'census tracts': [{"GEOID": "24033802405"}, {"GEOID": "24033802406"}],
+        'Not A Layer': [{"GEOID": "1"}],
+    })
+    assert [x.geoid for x in result.counties] == ['24033']
+    assert [x.geoid for x in result.tracts] == ['24033802405', '24033802406']
+    assert isinstance(result.counties[0], County) is True
+
+
+def test_from_dict_populates_micropolitan_nectas():
+    result = GeographyCollection.from_dict({
+        'Micropolitan New England City and Town Areas': [{"GEOID": "70750",
+                                                          "NAME": "Berlin, NH-VT"}],
+    })
+    assert [x.geoid for x in result.micropolitan_nectas] == ['70750']
+    assert isinstance(result.micropolitan_nectas[0], MicropolitanNECTA) is True
+    assert 'Micropolitan New England City and Town Areas' in result.to_dict()
+
+
+@pytest.mark.parametrize('property_name', [
+    'pumas',
+    'regions',
+    'counties',
+    'tracts',
+    'msa',
+    'state_legislative_districts_upper',
+    'state_legislative_districts_upper_2018',
+    'state_legislative_districts_upper_2010',
+    'census_designated_places',
+    'metropolitan_nectas',
+    'blocks_2020',
+])
+def test_layer_setters(property_name):
+    result = GeographyCollection()
+    setattr(result, property_name, [{"GEOID": "24033"}])
+    values = getattr(result, property_name)
+    assert len(values) == 1
+    assert values[0].geoid == '24033'
+
+
+@pytest.mark.parametrize('as_dict, expected', [
+    (None, 0),
+    ({
+        'Counties': [{"GEOID": "24033"}],
+        'Census Tracts': [{"GEOID": "24033802405"}, {"GEOID": "24033802406"}],
+    }, 3),
+])
+def test_len(as_dict, expected):
+    if as_dict:
+        result = GeographyCollection.from_dict(as_dict)
+    else:
+        result = GeographyCollection()
+
+    assert len(result) == expected
+
+    result.states.append(State())
+    assert len(result) == expected + 1
@@ -0,0 +1,186 @@
+"""
+***********************************
+tests/test_async
+***********************************
+
+Tests for the :func:`geocode_many` entry point.
+
+"""
+
+import asyncio
+import functools
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from census_geocoder import _async, errors, metaclasses
+from census_geocoder.locations import Location
+
+
+def matched_body(address):
+    return json.dumps({
+        'result': {
+            'input': {},
+            'addressMatches': [{'matchedAddress': address}]
+        }
+    }).encode('utf-8')
+
+
+class FakeCensusAPI(object):
+    """Request handler for :class:`httpx.MockTransport` that echoes the requested
+    address back as its match, after ``failures`` server errors per address."""
+
+    def __init__(self, failures = 0, delay = 0):
+        self.failures = failures
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, request):
+        address = parse_qs(urlparse(str(request.url)).query)['address'][0]
+        self.calls.append(address)
+        await asyncio.sleep(self.delay)
+
+        if self.calls.count(address) <= self.failures:
+            return httpx.Response(503, content = b'Service Unavailable')
+        if address == 'UNKNOWN':
+            return httpx.Response(200, content = b'{"result":{"addressMatches":[]}}')
+        if address == 'ERROR':
+            return httpx.Response(400, content = b'Bad Request')
+
+        return httpx.Response(200, content = matched_body(address))
+
+
+@pytest.fixture
+def census_api(monkeypatch):
+    """Route :func:`geocode_many` requests to a :class:`FakeCensusAPI`, skip the
+    retry delay, and reset the response cache."""
+    api = FakeCensusAPI()
+    monkeypatch.setattr(_async.httpx,
+                        'AsyncClient',
+                        functools.partial(httpx.AsyncClient,
+                                          transport = httpx.MockTransport(api)))
+    monkeypatch.setattr(_async, 'BASE_DELAY', 0)
+    metaclasses.clear_cache()
+    yield api
+    metaclasses.clear_cache()
+
+
+@pytest.fixture
+def raw_json(monkeypatch):
+    """Have :func:`geocode_many` return the decoded response bodies, so that results
+    can be matched to the addresses requested."""
+    monkeypatch.setattr(Location,
+                        'from_json',
+                        classmethod(lambda cls, as_dict: as_dict))
+
+
+def matched_addresses(results):
+    return [x['result']['addressMatches'][0]['matchedAddress'] for x in results]
+
+
+def test_geocode_many_keeps_order(census_api, raw_json):
+    census_api.delay = 0.01
+    addresses = [f'{index} MAIN ST' for index in range(10)]
+
+    results = asyncio.run(_async.geocode_many(addresses, concurrency = 3))
+
+    assert matched_addresses(results) == addresses
+
+
+def test_geocode_many_returns_locations(census_api):
+    results = asyncio.run(_async.geocode_many(['1 MAIN ST']))
+
+    assert len(results) == 1
+    assert isinstance(results[0], Location)
+
+
+@pytest.mark.parametrize('return_exceptions, error', [
+    (True, None),
+    (False, errors.EntityNotFoundError),
+])
+def test_geocode_many_return_exceptions(census_api,
+                                       raw_json,
+                                       return_exceptions,
+                                       error):
+    addresses = ['1 MAIN ST', 'UNKNOWN', 'ERROR', '2 MAIN ST']
+
+    if not error:
+        results = asyncio.run(_async.geocode_many(addresses,
+                                                  return_exceptions = return_exceptions))
+        assert matched_addresses([results[0], results[3]]) == ['1 MAIN ST', '2 MAIN ST']
+        assert isinstance(results[1], errors.EntityNotFoundError)
+        assert isinstance(results[2], errors.CensusAPIError)
+    else:
+        with pytest.raises(error):
+            asyncio.run(_async.geocode_many(addresses,
+                                            return_exceptions = return_exceptions))
+
+
+@pytest.mark.parametrize('failures, expected_calls, error', [
+    (0, 1, None),
+    (2, 3, None),
+    (_async.MAX_TRIES - 1, _async.MAX_TRIES, None),
+    (_async.MAX_TRIES, _async.MAX_TRIES, errors.CensusAPIError),
+])
+def test_geocode_many_retries(census_api, raw_json, failures, expected_calls, error):
+    census_api.failures = failures
+
+    if not error:
+        results = asyncio.run(_async.geocode_many(['1 MAIN ST']))
+        assert matched_addresses(results) == ['1 MAIN ST']
+    else:
+        with pytest.raises(error):
+            asyncio.run(_async.geocode_many(['1 MAIN ST']))
+
+    assert len(census_api.calls) == expected_calls
+
+
+def test_geocode_many_retries_transport_errors(census_api, monkeypatch):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        raise httpx.ConnectError('Connection refused', request = request)
+
+    monkeypatch.setattr(_async.httpx,
+                        'AsyncClient',
+                        functools.partial(httpx.AsyncClient,
+                                          transport = httpx.MockTransport(handler)))
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(_async.geocode_many(['1 MAIN ST']))
+
+    assert len(attempts) == _async.MAX_TRIES
+
+
+def test_geocode_many_deduplicates_through_cache(census_api, raw_json):
+    census_api.delay = 0.01
+
+    results = asyncio.run(_async.geocode_many(['1 MAIN ST'] * 8, concurrency = 1))
+
+    assert matched_addresses(results) == ['1 MAIN ST'] * 8
+    assert census_api.calls == ['1 MAIN ST']
+
+
+def test_geocode_many_invalid_address(census_api, raw_json):
+    addresses = ['1 MAIN ST', None, '', '2 MAIN ST']
+
+    results = asyncio.run(_async.geocode_many(addresses, return_exceptions = True))
+
+    assert matched_addresses([results[0], results[3]]) == ['1 MAIN ST', '2 MAIN ST']
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], ValueError)
+    assert sorted(census_api.calls) == ['1 MAIN ST', '2 MAIN ST']
+
+    with pytest.raises(ValueError):
+        asyncio.run(_async.geocode_many([None]))
+
+
+def test_geocode_many_without_httpx(monkeypatch):
+    monkeypatch.setattr(_async, 'httpx', None)
+
+    with pytest.raises(ImportError):
+        asyncio.run(_async.geocode_many(['1 MAIN ST']))
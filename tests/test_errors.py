@@ -0,0 +1,140 @@
+"""
+***********************************
+tests/test_errors
+***********************************
+
+Tests for the :class:`EntityNotFoundError` evaluation logic.
+
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from census_geocoder import errors
+
+MATCHED_LOCATION = b'{"result":{"addressMatches":[{"matchedAddress":"X"}]}}'
+UNMATCHED_LOCATION = b'{"result":{"addressMatches":[],"input":{"address":"X"}}}'
+
+
+def fake_response(content, status_code = 200):
+    """Return a minimal stand-in for :class:`requests.Response`."""
+    return SimpleNamespace(status_code = status_code, content = content)
+
+
+@pytest.fixture
+def evaluation_cache(monkeypatch):
+    """Start each test with an empty evaluation cache."""
+    monkeypatch.setattr(errors, '_EVALUATION_CACHE', errors.OrderedDict())
+    return errors._EVALUATION_CACHE
+
+
+def test_evaluation_cache_keys_on_content(evaluation_cache):
+    assert errors.EntityNotFoundError.evaluate(fake_response(MATCHED_LOCATION),
+                                               request_type = 'locations') is False
+    assert errors.EntityNotFoundError.evaluate(fake_response(UNMATCHED_LOCATION),
+                                               request_type = 'locations') is True
+
+    assert evaluation_cache[('locations', MATCHED_LOCATION)] is False
+    assert evaluation_cache[('locations', UNMATCHED_LOCATION)] is True
+
+    # Cached outcomes are returned unchanged.
+    assert errors.EntityNotFoundError.evaluate(fake_response(MATCHED_LOCATION),
+                                               request_type = 'locations') is False
+    assert errors.EntityNotFoundError.evaluate(fake_response(UNMATCHED_LOCATION),
+                                               request_type = 'locations') is True
+    assert len(evaluation_cache) == 2
+
+
+def test_evaluation_cache_is_thread_safe(monkeypatch, evaluation_cache):
+    monkeypatch.setattr(errors, '_EVALUATION_CACHE_SIZE', 4)
+    bodies = [b'{"result":{"addressMatches":[{"matchedAddress":"%d"}]}}' % index
+              for index in range(16)]
+    failures = []
+
+    def worker(offset):
+        try:
+            for index in range(500):
+                response = fake_response(bodies[(offset + index) % len(bodies)])
+                assert errors.EntityNotFoundError.evaluate(
+                    response,
+                    request_type = 'locations'
+                ) is False
+        except Exception as error:                                     # pragma: no cover
+            failures.append(error)
+
+    threads = [threading.Thread(target = worker, args = (offset,))
+               for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not failures
+    assert len(evaluation_cache) <= 4
+
+
+@pytest.mark.parametrize('content, status_code, request_type, expected_result', [
+    (MATCHED_LOCATION, 404, 'locations', True),
+    (b'', 404, None, True),
+
+    (b'', 200, 'locations', True),
+    (b'  \r\n', 200, 'locations', True),
+    (b'{}', 200, 'locations', True),
+    (b' { } \n', 200, 'geographies', True),
+    (b'[]', 200, 'locations', True),
+    (b'\t[ ]\r\n', 200, 'geographies', True),
+    (b'{"result": null}', 200, 'locations', True),
+    (b'{ "result" : { } }', 200, 'geographies', True),
+
+    (MATCHED_LOCATION, 200, None, False),
+    (UNMATCHED_LOCATION, 200, 'unknown', False),
+    (b'[1]', 200, 'locations', False),
+    (b'[1]', 200, 'geographies', False),
+    (b'"result"', 200, 'locations', False),
+    (b'Bad Request', 400, 'locations', False),
+    (b'<html><body>Service Unavailable</body></html>', 503, 'geographies', False),
+
+    (MATCHED_LOCATION, 200, 'locations', False),
+    (UNMATCHED_LOCATION, 200, 'locations', True),
+    (b'{"result":{"input":{}}}', 200, 'locations', True),
+
+    (b'{"result":{"geographies":{"States":[{"GEOID":"24"}]}}}', 200, 'geographies',
+     False),
+    (b'{"result":{"addressMatches":[{"matchedAddress":"X","geographies":{}}]}}', 200,
+     'geographies', False),
+    (b'{"result":{"geographies":{},"input":{}}}', 200, 'geographies', True),
+    (b'{"result":{"addressMatches":[],"input":{}}}', 200, 'geographies', True),
+])
+def test_EntityNotFoundError_evaluate(evaluation_cache,
+                                      content,
+                                      status_code,
+                                      request_type,
+                                      expected_result):
+    result = errors.EntityNotFoundError.evaluate(fake_response(content, status_code),
+                                                 request_type = request_type)
+    assert result is expected_result
+
+
+def test_parse_body_uses_a_parser_per_thread(monkeypatch):
+    class FakeParser(object):
+        instances = []
+
+        def __init__(self):
+            self.instances.append(self)
+
+        def parse(self, content):
+            return errors.orjson.loads(content)
+
+    monkeypatch.setattr(errors, 'simdjson', SimpleNamespace(Parser = FakeParser))
+    monkeypatch.setattr(errors, '_PARSERS', threading.local())
+
+    assert errors._parse_body(b'{"a":1}') == {'a': 1}
+    assert errors._parse_body(b'{"a":2}') == {'a': 2}
+    assert len(FakeParser.instances) == 1
+
+    thread = threading.Thread(target = errors._parse_body, args = (b'{}',))
+    thread.start()
+    thread.join()
+    assert len(FakeParser.instances) == 2
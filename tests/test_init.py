@@ -0,0 +1,54 @@
+"""
+***********************************
+tests/test_init
+***********************************
+
+Tests for the lazily-imported attributes of the :mod:`census_geocoder` package.
+
+"""
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+import census_geocoder
+from census_geocoder import geographies, locations, metaclasses
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('location', locations.Location),
+    ('geography', geographies.GeographicArea),
+    ('geography_collection', geographies.GeographyCollection),
+    ('matched_address', locations.MatchedAddress),
+    ('session', metaclasses.SESSION),
+    ('geocode_batch', locations.Location.from_batch),
+    ('locations', locations),
+    ('geographies', geographies),
+    ('metaclasses', metaclasses),
+])
+def test_lazy_attributes(name, expected):
+    assert getattr(census_geocoder, name) == expected
+    assert name in dir(census_geocoder)
+
+
+@pytest.mark.parametrize('name', census_geocoder.__all__)
+def test_all_is_importable(name):
+    assert getattr(census_geocoder, name) is not None
+
+
+def test_errors_is_a_module():
+    assert isinstance(census_geocoder.errors, types.ModuleType)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        census_geocoder.not_an_attribute
+
+
+@pytest.mark.parametrize('name', ['locations', 'geographies', 'metaclasses', 'errors'])
+def test_bare_import_exposes_submodules(name):
+    code = f'import census_geocoder; assert hasattr(census_geocoder, {name!r})'
+
+    subprocess.run([sys.executable, '-c', code], check = True)
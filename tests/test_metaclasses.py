@@ -0,0 +1,253 @@
+"""
+***********************************
+tests/test_metaclasses
+***********************************
+
+Tests for the module-level helpers in :mod:`census_geocoder.metaclasses`.
+
+"""
+
+import os
+import pathlib
+import threading
+from types import SimpleNamespace
+
+import pytest
+from tests.fixtures import input_files
+
+from census_geocoder import errors, metaclasses
+from census_geocoder.locations import Location
+
+MATCHED_BODY = b'{"result":{"addressMatches":[{"matchedAddress":"4600 SILVER HILL RD"}]}}'
+
+
+class FakeGet(object):
+    """Stand-in for :meth:`requests.Session.get` that counts its calls."""
+
+    def __init__(self, content = MATCHED_BODY, status_code = 200):
+        self.content = content
+        self.status_code = status_code
+        self.calls = []
+
+    def __call__(self, url, *args, **kwargs):
+        self.calls.append(url)
+        return SimpleNamespace(status_code = self.status_code,
+                               content = self.content,
+                               text = self.content.decode('utf-8'))
+
+
+@pytest.fixture
+def fake_get(monkeypatch):
+    """Replace ``SESSION.get`` with a :class:`FakeGet` and reset the response cache."""
+    fake = FakeGet()
+    monkeypatch.setattr(metaclasses.SESSION, 'get', fake)
+    metaclasses.disable_disk_cache()
+    metaclasses.clear_cache()
+    yield fake
+    metaclasses.disable_disk_cache()
+    metaclasses.clear_cache()
+
+
+def get_one_line(address = '4600 Silver Hill Rd, Washington, DC 20233'):
+    return Location._get_one_line(one_line = address,
+                                  benchmark = 'Current',
+                                  vintage = 'Current',
+                                  layers = 'all')
+
+
+def test_repeat_request_is_cached(fake_get):
+    first = get_one_line()
+    second = get_one_line()
+
+    assert first == second
+    assert len(fake_get.calls) == 1
+
+
+def test_cache_key_is_normalized(fake_get):
+    get_one_line('4600 Silver Hill Rd, Washington, DC 20233')
+    get_one_line('4600 SILVER HILL RD, WASHINGTON, DC 20233  ')
+
+    assert len(fake_get.calls) == 1
+
+
+def test_clear_cache(fake_get):
+    get_one_line()
+    metaclasses.clear_cache()
+    get_one_line()
+
+    assert len(fake_get.calls) == 2
+
+
+def test_disk_cache(fake_get, tmp_path):
+    pytest.importorskip('diskcache')
+
+    metaclasses.enable_disk_cache(str(tmp_path), size_limit_gb = 0.01)
+    get_one_line()
+
+    with metaclasses._CACHE_LOCK:
+        metaclasses._RESPONSE_CACHE.clear()
+
+    get_one_line()
+    assert len(fake_get.calls) == 1
+
+    metaclasses.disable_disk_cache()
+    metaclasses.clear_cache()
+    get_one_line()
+    assert len(fake_get.calls) == 2
+
+    metaclasses.enable_disk_cache(str(tmp_path), size_limit_gb = 0.01)
+    metaclasses.clear_cache()
+    get_one_line()
+    assert len(fake_get.calls) == 3
+
+
+def test_enable_disk_cache_without_diskcache(monkeypatch):
+    monkeypatch.setattr(metaclasses, 'diskcache', None)
+
+    with pytest.raises(ImportError):
+        metaclasses.enable_disk_cache()
+
+
+def test_cache_is_thread_safe(monkeypatch, fake_get):
+    monkeypatch.setattr(metaclasses, 'CACHE_SIZE', 8)
+    failures = []
+
+    def worker(offset):
+        try:
+            for index in range(500):
+                key = (offset + index) % 32
+                metaclasses._set_cached(key, b'{}')
+                metaclasses._get_cached(key)
+        except Exception as error:                                     # pragma: no cover
+            failures.append(error)
+
+    threads = [threading.Thread(target = worker, args = (offset,))
+               for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not failures
+    assert len(metaclasses._RESPONSE_CACHE) <= 8
+
+
+class FakePostBatch(object):
+    """Stand-in for :func:`metaclasses._post_batch` that records each payload."""
+
+    def __init__(self):
+        self.payloads = []
+
+    def __call__(self, url, address_file):
+        if isinstance(address_file[1], str):
+            self.payloads.append(address_file[1])
+        else:
+            self.payloads.append(address_file[1].read().decode('utf-8'))
+        return []
+
+
+@pytest.fixture
+def fake_post_batch(monkeypatch):
+    """Replace ``_post_batch`` with a :class:`FakePostBatch`."""
+    fake = FakePostBatch()
+    monkeypatch.setattr(metaclasses, '_post_batch', fake)
+    return fake
+
+
+@pytest.mark.parametrize('record_count, chunk_size, expected_chunks, error', [
+    (0, 3, [], None),
+    (1, 3, [1], None),
+    (3, 3, [3], None),
+    (7, 3, [3, 3, 1], None),
+    (7, 1, [1] * 7, None),
+
+    (7, 0, None, ValueError),
+    (7, 10001, None, errors.BatchSizeTooLargeError),
+])
+def test_get_batch_records_chunking(fake_post_batch,
+                                    record_count,
+                                    chunk_size,
+                                    expected_chunks,
+                                    error):
+    records = ((str(index), f'{index} Main St', 'Washington', 'DC', '20233')
+               for index in range(record_count))
+
+    if not error:
+        result = Location._get_batch_records(records, chunk_size = chunk_size)
+        assert result == []
+        assert [len(payload.splitlines())
+                for payload in fake_post_batch.payloads] == expected_chunks
+
+        rows = [row for payload in fake_post_batch.payloads
+                for row in payload.splitlines()]
+        assert rows == [f'{index},{index} Main St,Washington,DC,20233'
+                        for index in range(record_count)]
+    else:
+        with pytest.raises(error):
+            result = Location._get_batch_records(records, chunk_size = chunk_size)
+
+
+@pytest.mark.parametrize('records', [
+    ['4600 Silver Hill Rd, Washington, DC 20233'],
+    [b'4600 Silver Hill Rd, Washington, DC 20233'],
+    [('1', '4600 Silver Hill Rd', 'Washington', 'DC', '20233'),
+     '4600 Silver Hill Rd, Washington, DC 20233'],
+])
+def test_get_batch_records_rejects_strings(fake_post_batch, records):
+    with pytest.raises(errors.MalformedBatchFileError):
+        Location._get_batch_records(records)
+
+
+@pytest.mark.parametrize('as_type', [str, bytes, pathlib.Path])
+def test_from_batch_file_dispatch(input_files, fake_post_batch, as_type):
+    filename = os.path.join(input_files, 'successful_batch.csv')
+    if as_type is bytes:
+        filename = os.fsencode(filename)
+    else:
+        filename = as_type(filename)
+
+    assert Location.from_batch(filename) == []
+    with open(os.fsdecode(filename), 'r') as file_object:
+        assert fake_post_batch.payloads == [file_object.read()]
+
+
+@pytest.mark.parametrize('records', [
+    [('1', '4600 Silver Hill Rd', 'Washington', 'DC', '20233')],
+    (('1', '4600 Silver Hill Rd', 'Washington', 'DC', '20233'),),
+    iter([['1', '4600 Silver Hill Rd', 'Washington', 'DC', '20233']]),
+])
+def test_from_batch_records_dispatch(fake_post_batch, records):
+    assert Location.from_batch(addresses = records, chunk_size = 10) == []
+    assert [payload.splitlines() for payload in fake_post_batch.payloads] == [
+        ['1,4600 Silver Hill Rd,Washington,DC,20233']
+    ]
+
+
+BATCH_RESPONSE = b'''"1","4600 Silver Hill Road, Washington, DC, 20233","Match","Exact","4600 SILVER HILL RD, WASHINGTON, DC, 20233","-76.92744,38.845985","76355984","L","24","033","802405","1084"
+"2","400 15th St SE, Washington, DC, 20003","Match","Non_Exact","400 15TH ST SE, WASHINGTON, DC, 20003","-76.98259,38.882915","76225813","L","11","001","006804","1003"
+"3","1 Nowhere Lane, Nowhere, ZZ, 00000","No_Match"
+"4","2 Somewhere St, , ,","Tie"
+
+"5","","No_Match"
+"6","4600 Silver Hill Road, Washington, DC, 20233","Match","Exact","4600 SILVER HILL RD, WASHINGTON, DC, 20233","-76.92744,38.845985","76355984","L"
+'''
+
+WIDE_BATCH_RESPONSE = BATCH_RESPONSE + b'"7",' + b','.join([b'"x"'] * 12) + b'\n'
+
+
+@pytest.mark.parametrize('content, expected_lengths', [
+    (b'', []),
+    (b'  \n', []),
+    (BATCH_RESPONSE, [12, 12, 3, 3, 3, 8]),
+    (WIDE_BATCH_RESPONSE, [12, 12, 3, 3, 3, 8, 13]),
+], ids = ['empty', 'blank', 'response', 'wide_response'])
+def test_parse_batch_csv_parity(monkeypatch, content, expected_lengths):
+    pytest.importorskip('pandas')
+
+    with_pandas = metaclasses._parse_batch_csv(content)
+
+    monkeypatch.setattr(metaclasses, 'pandas', None)
+    with_csv = metaclasses._parse_batch_csv(content)
+
+    assert with_pandas == with_csv
+    assert [len(row) for row in with_csv] == expected_lengths